@@ -79,11 +79,11 @@ class BaseAI(AIInterface):
         """Apply specific AI strategy - to be overridden by subclasses"""
         # Use advanced move evaluation
         if moves:
-            ranked_moves = self.move_evaluator.get_move_rankings(moves, hand, game_state, self.game_type)
+            best = self.move_evaluator.get_best_move(moves, hand, game_state, self.game_type)
             
             # Select best move
-            if ranked_moves:
-                best_move, best_score = ranked_moves[0]
+            if best:
+                best_move, best_score = best
                 if hasattr(best_move, 'cards') and best_score > 0.1:  # Lower threshold
                     return PlayerAction.PLAY_CARDS, best_move.cards
         
@@ -113,8 +113,8 @@ class BaseAI(AIInterface):
         
         return {
             "memory_enabled": True,
-            "played_cards_count": len(self.card_memory.played_cards),
-            "remaining_cards_count": len(self.card_memory.remaining_cards),
+            "played_cards_count": self.card_memory.get_played_count(),
+            "remaining_cards_count": self.card_memory.get_remaining_count(),
             "move_history_count": len(self.card_memory.move_history),
             "strategic_insights": self.card_memory.get_strategic_insights()
         }
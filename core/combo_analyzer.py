@@ -4,10 +4,16 @@ Extracted from model_build/scripts/unbeatable/unbeatable_sequence_model.py
 """
 
 import logging
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Tuple
 
 logger = logging.getLogger(__name__)
 
+# (combo_type, rank_value, card count) -> calculate_combo_strength result,
+# filled on first use. Card count is 0 for everything but straights. Real
+# combos need ~220 keys; past the bound, unusual keys are computed unstored.
+_COMBO_STRENGTH_TABLE: Dict[Tuple[str, int, int], float] = {}
+_COMBO_STRENGTH_TABLE_SIZE = 1024
+
 
 class ComboAnalyzer:
     """Core combo analysis logic - reusable for different card games"""
@@ -248,9 +254,37 @@ class ComboAnalyzer:
             Strength value between 0.0 and 1.0
         """
         combo_type = combo['combo_type']
-        rank_value = combo.get('rank_value', 0)  # 0..12 where 12 == 2, 11 == A
-        cards = combo.get('cards', [])
+        # Only straights depend on their cards (their length)
+        length = len(combo.get('cards', [])) if combo_type == 'straight' else 0
+        return ComboAnalyzer.strength_of(combo_type, combo.get('rank_value', 0), length)
 
+    @staticmethod
+    def strength_of(combo_type: str, rank_value: int, length: int = 0) -> float:
+        """
+        calculate_combo_strength from the combo's shape, via the shared strength table
+        
+        Args:
+            combo_type: Combo type name
+            rank_value: Rank value 0..12 (12 == 2, 11 == A)
+            length: Card count (only used for straights)
+            
+        Returns:
+            Strength value between 0.0 and 1.0
+        """
+        if combo_type != 'straight':
+            length = 0
+        key = (combo_type, rank_value, length)
+        strength = _COMBO_STRENGTH_TABLE.get(key)
+        if strength is None:
+            strength = ComboAnalyzer._strength_for(combo_type, rank_value, length)
+            if len(_COMBO_STRENGTH_TABLE) < _COMBO_STRENGTH_TABLE_SIZE:
+                _COMBO_STRENGTH_TABLE[key] = strength
+        return strength
+
+    @staticmethod
+    def _strength_for(combo_type: str, rank_value: int, length: int) -> float:
+        """Formula behind calculate_combo_strength: a pure function of
+        (combo_type, rank_value 0..12 where 12 == 2 / 11 == A, card count)"""
         is_two = (rank_value == 12)
         is_ace = (rank_value == 11)
         is_face = rank_value in (8, 9, 10)  # J, Q, K
@@ -258,11 +292,8 @@ class ComboAnalyzer:
 
         # Straights
         if combo_type == 'straight':
-            length = len(cards)
             if length >= 10:
                 return 1.0  # Sảnh rồng
-            ranks = [c % 13 for c in cards]
-            has_ace = any(r == 11 for r in ranks)
             if is_ace:
                 return 1.0  # Ace-high straight
             
@@ -324,3 +355,4 @@ class ComboAnalyzer:
             return 0.95 + (rank_value / 11.0) * 0.03
 
         return 0.1  # Fallback
+
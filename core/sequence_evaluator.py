@@ -7,6 +7,8 @@ Evaluates top sequences from a hand using beam search and rule-based scoring
 import itertools
 from typing import List, Dict, Any, Tuple, Set, Optional
 from collections import defaultdict
+from concurrent.futures import Executor
+from functools import partial
 import sys
 import os
 
@@ -18,6 +20,9 @@ if project_root not in sys.path:
 
 from ai_common.core.combo_analyzer import ComboAnalyzer
 
+# Read once at import; set SEQ_DEBUG=1 to print top-k candidates
+_SEQ_DEBUG = os.environ.get('SEQ_DEBUG', '0') == '1'
+
 
 class SequenceEvaluator:
     """
@@ -68,7 +73,11 @@ class SequenceEvaluator:
             combo_count = len(score['sequence'])
             avg_strength = score['total_strength'] / max(1, combo_count)
             
-            ordered_sequence = self._order_sequence(score['sequence'])
+            # Beam sequences arrive ordered; only cleanup combos need a re-sort
+            if combo_count == len(sequence):
+                ordered_sequence = score['sequence']
+            else:
+                ordered_sequence = self._order_sequence(score['sequence'])
             
             scored_sequences.append({
                 'sequence': ordered_sequence,
@@ -86,28 +95,49 @@ class SequenceEvaluator:
         topk = scored_sequences[:k]
 
         # Optional debug logging
-        try:
-            import os
-            if os.environ.get('SEQ_DEBUG', '0') == '1':
-                print(f"[SEQ_DEBUG] Hand size={len(hand)} candidates={len(topk)} (enforce_full_coverage={enforce_full_coverage})")
-                for idx, item in enumerate(topk):
-                    seq = item['sequence']
-                    combos_view = [
-                        {
-                            'i': i,
-                            't': c.get('type'),
-                            'r': c.get('rank_value'),
-                            'len': len(c.get('cards', [])),
-                            's': round(c.get('strength', 0.0), 3)
-                        } for i, c in enumerate(seq)
-                    ]
-                    print(f"[SEQ_DEBUG] #{idx+1} total={item['total_strength']:.3f} cov={item['coverage_score']:.2f} avg={item['avg_combo_strength']:.3f} combos={len(seq)}")
-                    print(f"[SEQ_DEBUG]      {combos_view}")
-        except Exception:
-            pass
+        if _SEQ_DEBUG:
+            print(f"[SEQ_DEBUG] Hand size={len(hand)} candidates={len(topk)} (enforce_full_coverage={enforce_full_coverage})")
+            for idx, item in enumerate(topk):
+                seq = item['sequence']
+                combos_view = [
+                    {
+                        'i': i,
+                        't': c.get('type'),
+                        'r': c.get('rank_value'),
+                        'len': len(c.get('cards', [])),
+                        's': round(c.get('strength', 0.0), 3)
+                    } for i, c in enumerate(seq)
+                ]
+                print(f"[SEQ_DEBUG] #{idx+1} total={item['total_strength']:.3f} cov={item['coverage_score']:.2f} avg={item['avg_combo_strength']:.3f} combos={len(seq)}")
+                print(f"[SEQ_DEBUG]      {combos_view}")
 
         return topk
     
+    def evaluate_top_sequences_batch(self, hands: List[List[int]], k: int = 3, beam_size: int = 50,
+                                     enforce_full_coverage: bool = None, executor: Optional[Executor] = None,
+                                     chunksize: int = 32, min_parallel_hands: int = 8) -> List[List[Dict[str, Any]]]:
+        """
+        Evaluate many independent hands, optionally on a caller-owned pool
+        
+        Args:
+            hands: List of hands (each a list of card IDs)
+            k: Number of top sequences per hand
+            beam_size: Beam search width
+            enforce_full_coverage: Same as evaluate_top_sequences
+            executor: Process pool to reuse across calls (None runs serially)
+            chunksize: Hands sent to a worker per task
+            min_parallel_hands: Smaller batches run serially even with an executor
+            
+        Returns:
+            List of evaluate_top_sequences results, in the same order as hands
+        """
+        evaluate = partial(self.evaluate_top_sequences, k=k, beam_size=beam_size,
+                           enforce_full_coverage=enforce_full_coverage)
+        if executor is None or len(hands) < max(2, min_parallel_hands):
+            return [evaluate(hand) for hand in hands]
+        
+        return list(executor.map(evaluate, hands, chunksize=max(1, chunksize)))
+    
     def _build_rank_to_cards(self, hand: List[int]) -> Dict[int, List[int]]:
         rank_to_cards: Dict[int, List[int]] = {}
         for card in sorted(hand):
@@ -128,7 +158,7 @@ class SequenceEvaluator:
                     'type': 'single',
                     'rank_value': rank,
                     'cards': card_ranks,
-                    'strength': self._calculate_strength_from_ranks('single', rank, card_ranks, rank_to_cards)
+                    'strength': self._calculate_strength_from_ranks('single', rank, card_ranks)
                 })
             
             # Pairs
@@ -138,7 +168,7 @@ class SequenceEvaluator:
                     'type': 'pair',
                     'rank_value': rank,
                     'cards': card_ranks,
-                    'strength': self._calculate_strength_from_ranks('pair', rank, card_ranks, rank_to_cards)
+                    'strength': self._calculate_strength_from_ranks('pair', rank, card_ranks)
                 })
             
             # Triples
@@ -148,7 +178,7 @@ class SequenceEvaluator:
                     'type': 'triple',
                     'rank_value': rank,
                     'cards': card_ranks,
-                    'strength': self._calculate_strength_from_ranks('triple', rank, card_ranks, rank_to_cards)
+                    'strength': self._calculate_strength_from_ranks('triple', rank, card_ranks)
                 })
             
             # Four of a kind
@@ -158,7 +188,7 @@ class SequenceEvaluator:
                     'type': 'four_kind',
                     'rank_value': rank,
                     'cards': card_ranks,
-                    'strength': self._calculate_strength_from_ranks('four_kind', rank, card_ranks, rank_to_cards)
+                    'strength': self._calculate_strength_from_ranks('four_kind', rank, card_ranks)
                 })
         
         # Generate all possible straights (3+ consecutive ranks, allowing wrap-around)
@@ -180,7 +210,7 @@ class SequenceEvaluator:
                         'type': 'double_seq',
                         'rank_value': window[0],
                         'cards': double_seq_cards,
-                        'strength': self._calculate_strength_from_ranks('double_seq', window[0], double_seq_cards, rank_to_cards)
+                        'strength': self._calculate_strength_from_ranks('double_seq', window[0], double_seq_cards)
                     })
         
         return combos
@@ -221,7 +251,7 @@ class SequenceEvaluator:
                         'type': 'straight',
                         'rank_value': signature[0],
                         'cards': list(signature),
-                        'strength': self._calculate_strength_from_ranks('straight', signature[0], list(signature), rank_to_cards)
+                        'strength': self._calculate_strength_from_ranks('straight', signature[0], list(signature))
                     })
         return combos
     
@@ -230,8 +260,7 @@ class SequenceEvaluator:
             return sequence
         
         seq = sorted(sequence, key=lambda c: c.get('strength', 0.0))
-        strengths = [c.get('strength', 0.0) for c in seq]
-        second_weakest = strengths[1] if len(strengths) > 1 else strengths[0]
+        second_weakest = seq[1 if len(seq) > 1 else 0].get('strength', 0.0)
         
         if second_weakest <= 0.5:
             return seq  # keep weak→strong
@@ -245,28 +274,10 @@ class SequenceEvaluator:
             ordered.append(weakest)
         return ordered
     
-    def _calculate_strength_from_ranks(self, combo_type: str, rank_value: int, card_ranks: List[int], rank_to_cards: Dict[int, List[int]]) -> float:
-        sample_cards = self._sample_cards_from_ranks(card_ranks, rank_to_cards)
-        if not sample_cards:
-            return 0.0
-        combo_payload = {
-            'combo_type': combo_type,
-            'rank_value': rank_value,
-            'cards': sample_cards
-        }
-        return self.combo_analyzer.calculate_combo_strength(combo_payload)
-    
-    def _sample_cards_from_ranks(self, card_ranks: List[int], rank_to_cards: Dict[int, List[int]]) -> List[int]:
-        temp_usage: Dict[int, int] = {}
-        taken: List[int] = []
-        for rank in card_ranks:
-            usage = temp_usage.get(rank, 0)
-            cards = rank_to_cards.get(rank, [])
-            if usage >= len(cards):
-                return []
-            taken.append(cards[usage])
-            temp_usage[rank] = usage + 1
-        return taken
+    def _calculate_strength_from_ranks(self, combo_type: str, rank_value: int, card_ranks: List[int]) -> float:
+        # Strength depends only on (type, rank, length), never on suits, so no
+        # concrete cards are sampled here; cards are bound in _consume_cards_for_combo
+        return ComboAnalyzer.strength_of(combo_type, rank_value, len(card_ranks))
     
     def _beam_search_sequences(self, combos: List[Dict[str, Any]], rank_to_cards: Dict[int, List[int]], beam_size: int) -> List[List[Dict[str, Any]]]:
         """Generate top sequences using priority-guided greedy construction"""
@@ -274,6 +285,7 @@ class SequenceEvaluator:
             return []
         
         top_sequences: List[List[Dict[str, Any]]] = []
+        top_avgs: List[float] = []
         seen_signatures = set()
         
         # Sort combos by priority and intrinsic strength
@@ -287,14 +299,17 @@ class SequenceEvaluator:
             reverse=True
         )
         
+        # Parallel per-combo columns, built once instead of per start combo
+        strengths = [c.get('strength', 0.0) for c in sorted_combos]
+        demands = [self._rank_demand(c.get('cards', [])) for c in sorted_combos]
+        
         top_avg_threshold = 0.0
         
-        for start_combo in sorted_combos:
-            start_strength = start_combo.get('strength', 0.0)
+        for start_idx, start_strength in enumerate(strengths):
             if len(top_sequences) >= beam_size and start_strength <= top_avg_threshold:
                 break
             
-            sequence = self._build_sequence_from_start(start_combo, sorted_combos, rank_to_cards)
+            sequence = self._build_sequence_from_start(start_idx, sorted_combos, demands, rank_to_cards)
             if not sequence:
                 continue
             
@@ -306,19 +321,21 @@ class SequenceEvaluator:
                 continue
             
             seen_signatures.add(signature)
-            top_sequences.append(self._order_sequence(sequence))
+            top_sequences.append(sequence)
+            top_avgs.append(sum(c.get('strength', 0.0) for c in sequence) / max(1, len(sequence)))
             
+            if len(top_sequences) > beam_size:
+                # Beam grows one at a time, so only the single weakest entry is evicted
+                drop_idx = top_avgs.index(min(top_avgs))
+                del top_sequences[drop_idx]
+                del top_avgs[drop_idx]
             if len(top_sequences) >= beam_size:
-                # Estimate avg strength for thresholding using raw strengths
-                scored = sorted(
-                    (
-                        sum(c.get('strength', 0.0) for c in seq) / max(1, len(seq)),
-                        seq
-                    )
-                    for seq in top_sequences
-                )
-                top_sequences = [seq for _, seq in scored[-beam_size:]]
-                top_avg_threshold = scored[-beam_size][0]
+                top_avg_threshold = min(top_avgs)
+        
+        if len(top_sequences) >= beam_size:
+            # Full beam is reported weak -> strong by raw average strength
+            order = sorted(range(len(top_sequences)), key=top_avgs.__getitem__)
+            top_sequences = [top_sequences[i] for i in order]
         
         return top_sequences
     
@@ -334,43 +351,42 @@ class SequenceEvaluator:
         }
         return priority_map.get(combo_type or 'single', 1)
     
-    def _build_sequence_from_start(self, start_combo: Dict[str, Any], sorted_combos: List[Dict[str, Any]], rank_to_cards: Dict[int, List[int]]) -> List[Dict[str, Any]]:
+    def _build_sequence_from_start(self, start_idx: int, sorted_combos: List[Dict[str, Any]], demands: List[Tuple[Tuple[int, int], ...]], rank_to_cards: Dict[int, List[int]]) -> List[Dict[str, Any]]:
         available = {rank: list(cards) for rank, cards in rank_to_cards.items()}
         
-        start_cards = self._consume_cards_for_combo(start_combo, available)
+        start_cards = self._consume_cards_for_combo(demands[start_idx], available)
         if start_cards is None:
             return []
         
-        sequence = [self._with_cards(start_combo, start_cards)]
+        sequence = [self._with_cards(sorted_combos[start_idx], start_cards)]
         
-        for combo in sorted_combos:
-            if combo is start_combo:
+        for idx, demand in enumerate(demands):
+            if idx == start_idx:
                 continue
-            combo_cards = self._consume_cards_for_combo(combo, available)
+            combo_cards = self._consume_cards_for_combo(demand, available)
             if combo_cards is None:
                 continue
-            sequence.append(self._with_cards(combo, combo_cards))
+            sequence.append(self._with_cards(sorted_combos[idx], combo_cards))
         
         return self._order_sequence(sequence)
     
-    def _consume_cards_for_combo(self, combo: Dict[str, Any], available: Dict[int, List[int]]) -> Optional[List[int]]:
-        card_ranks = combo.get('cards', [])
-        if not card_ranks:
-            return []
-        
+    def _rank_demand(self, card_ranks: List[int]) -> Tuple[Tuple[int, int], ...]:
+        """(rank, count) pairs in first-seen order, so consumption order matches card_ranks"""
         demand: Dict[int, int] = {}
         for rank in card_ranks:
             demand[rank] = demand.get(rank, 0) + 1
-        
-        for rank, count in demand.items():
+        return tuple(demand.items())
+    
+    def _consume_cards_for_combo(self, demand: Tuple[Tuple[int, int], ...], available: Dict[int, List[int]]) -> Optional[List[int]]:
+        for rank, count in demand:
             if len(available.get(rank, [])) < count:
                 return None
         
         taken: List[int] = []
-        for rank in card_ranks:
-            pool = available.get(rank, [])
-            chosen = pool.pop()
-            taken.append(chosen)
+        for rank, count in demand:
+            pool = available[rank]
+            for _ in range(count):
+                taken.append(pool.pop())
         
         return taken
     
@@ -61,8 +61,9 @@ from __future__ import annotations
 
 import json
 import os
-from datetime import datetime
-from typing import Any, Dict, Optional, List
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Optional, List, Tuple
 
 # Template describing required top-level keys and their types at a high level
 DATASET_REQUIRED_KEYS: List[str] = [
@@ -79,6 +80,21 @@ DATASET_REQUIRED_KEYS: List[str] = [
     "meta",
 ]
 
+# (last formatted UTC second, its "YYYY-MM-DDTHH:MM:SS" prefix); replaced as
+# one tuple so concurrent writers never see a second paired with another prefix
+_ts_prefix_cache: Tuple[int, str] = (-1, "")
+
+
+def _fast_iso_ts() -> str:
+    """UTC ISO-8601 timestamp with microseconds, formatting the date part once per second."""
+    global _ts_prefix_cache
+    sec, ns = divmod(time.time_ns(), 1_000_000_000)
+    cached_sec, prefix = _ts_prefix_cache
+    if sec != cached_sec:
+        prefix = time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime(sec))
+        _ts_prefix_cache = (sec, prefix)
+    return f"{prefix}.{ns // 1000:06d}"
+
 
 class JSONLLogger:
     """Append-only JSONLines logger.
@@ -86,11 +102,17 @@ class JSONLLogger:
     Parameters:
         file_path: Path to the .jsonl file
         include_timestamp: If True, add an ISO timestamp to each record
+        dedupe: If True, drop write_action calls that repeat an already
+            written (game, round, turn, player, action) record
     """
 
-    def __init__(self, file_path: str, include_timestamp: bool = True) -> None:
+    _DEDUPE_CACHE_SIZE = 1024
+
+    def __init__(self, file_path: str, include_timestamp: bool = True, dedupe: bool = False) -> None:
         self.file_path = file_path
         self.include_timestamp = include_timestamp
+        self.dedupe = dedupe
+        self._seen_actions: "OrderedDict[Any, None]" = OrderedDict()
         # Ensure parent directory exists if provided
         parent = os.path.dirname(os.path.abspath(file_path))
         if parent and not os.path.exists(parent):
@@ -104,7 +126,7 @@ class JSONLLogger:
     def write_record(self, record: Dict[str, Any]) -> None:
         """Write a single record as a JSON line."""
         if self.include_timestamp:
-            record.setdefault("timestamp", datetime.utcnow().isoformat())
+            record.setdefault("timestamp", _fast_iso_ts())
         with open(self.file_path, "a", encoding="utf-8") as f:
             json.dump(record, f, ensure_ascii=False)
             f.write("\n")
@@ -115,6 +137,22 @@ class JSONLLogger:
         The game_record should match BaseGame.get_game_record() shape.
         action_record may be legacy flat shape or the new two-stage schema.
         """
+        if self.dedupe:
+            # Fingerprint before any merging so repeated calls cost one repr()
+            fp = (
+                game_record.get("game_id"),
+                game_record.get("round_id"),
+                game_record.get("turn_id"),
+                game_record.get("player_id"),
+                repr(action_record),
+                repr(extra),
+            )
+            if fp in self._seen_actions:
+                self._seen_actions.move_to_end(fp)
+                return
+            self._seen_actions[fp] = None
+            if len(self._seen_actions) > self._DEDUPE_CACHE_SIZE:
+                self._seen_actions.popitem(last=False)
         merged: Dict[str, Any] = {**game_record}
         merged["action"] = normalize_action_record(action_record)
         # Normalize general-play fields for model compatibility
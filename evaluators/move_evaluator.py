@@ -2,19 +2,72 @@
 Advanced Move Evaluator - Sophisticated move evaluation logic
 """
 
-from typing import List, Dict, Set, Optional
+from collections import OrderedDict
+from operator import itemgetter
+from typing import Any, List, Dict, NamedTuple, Set, Optional, Tuple
 from game_engine.core.card_encoding import Card, Rank, Suit
 from game_engine.core.game_entities import Move, GameState
 from game_engine.core.combo_validator import ComboType
+from ..memory.card_memory import CardMemory
 from ..penalty_avoidance.penalty_checker import PenaltyChecker
 from ..penalty_avoidance.penalty_types import PenaltyRisk
 
 
+# Per-card "dangerous card" bonus: 2♠ 0.3, the other 2s 0.2, K/A 0.1
+_DANGEROUS_CARD_BONUS = {}
+for _card in (Card.from_id(card_id) for card_id in range(52)):
+    if _card.rank == Rank.TWO:
+        _DANGEROUS_CARD_BONUS[_card] = 0.3 if _card.suit == Suit.SPADES else 0.2
+    elif _card.rank.value >= 10:
+        _DANGEROUS_CARD_BONUS[_card] = 0.1
+del _card
+
+# Penalty-avoidance score deduction per PenaltySeverity (LOW, MEDIUM, HIGH, CRITICAL)
+_SEVERITY_PENALTY = (0.0, 0.2, 0.4, 0.8)
+
+# Combo type preferences for _evaluate_combo_efficiency
+_COMBO_PREFERENCES = {
+    ComboType.SINGLE: 0.3,      # Basic, good for dumping
+    ComboType.PAIR: 0.5,        # Good for clearing pairs
+    ComboType.TRIPLE: 0.7,      # Very good for clearing
+    ComboType.FOUR_KIND: 0.9,   # Excellent, powerful
+    ComboType.STRAIGHT: 0.6,    # Good for clearing multiple
+    ComboType.DOUBLE_SEQ: 0.8,  # Very good for clearing
+    ComboType.THREE_CONSECUTIVE_PAIRS: 0.9,  # Powerful
+    ComboType.FOUR_CONSECUTIVE_PAIRS: 1.0,   # Most powerful
+    ComboType.SPECIAL: 1.0      # Best, rare combos
+}
+
+
+class _EvalContext(NamedTuple):
+    """Per-(hand, game state) aggregates shared by every candidate move"""
+    hand_bb: int
+    hand_size: int
+    player_hand_sizes: Tuple[int, ...]
+    game_type: str
+    strategic_score: float
+
+
 class MoveEvaluator:
-    """Advanced move evaluation with multiple criteria"""
+    """Advanced move evaluation with multiple criteria
+    
+    Scores are deterministic in (move cards, combo type, hand, opponent hand
+    sizes, game type), so they are memoized in a bounded LRU keyed by the
+    move's cards; penalty checks are memoized by the remaining-hand bitboard.
+    Nothing is stored on the caller's Move objects.
+    """
+    
+    _SCORE_CACHE_SIZE = 65536
+    _PENALTY_CACHE_SIZE = 8192
     
     def __init__(self):
         self.penalty_checker = PenaltyChecker()
+        self.reset()
+    
+    def reset(self):
+        """Drop memoized scores and penalty checks"""
+        self._score_cache: "OrderedDict[Any, float]" = OrderedDict()
+        self._penalty_cache: Dict[Any, tuple] = {}
     
     def evaluate_move(
         self, 
@@ -29,9 +82,58 @@ class MoveEvaluator:
         Returns:
             Score from 0.0 (worst) to 1.0 (best)
         """
-        if not hasattr(move, 'cards') or not move.cards:
+        if not getattr(move, 'cards', None):
             return 0.0
         
+        ctx = self._build_context(hand, game_state, game_type)
+        return self._evaluate_move_cached(move, hand, game_state, ctx)
+    
+    def _build_context(self, hand: List[Card], game_state: GameState, game_type: str) -> _EvalContext:
+        """Walk hand and players once; everything besides the move a score depends on"""
+        hand_size = len(hand)
+        player_hand_sizes = tuple(len(p.hand) for p in game_state.players)
+        return _EvalContext(
+            hand_bb=CardMemory.bitboard(hand),
+            hand_size=hand_size,
+            player_hand_sizes=player_hand_sizes,
+            game_type=game_type,
+            strategic_score=self._strategic_value_from_sizes(hand_size, player_hand_sizes),
+        )
+    
+    def _evaluate_move_cached(
+        self,
+        move: Move,
+        hand: List[Card],
+        game_state: GameState,
+        ctx: _EvalContext
+    ) -> float:
+        """evaluate_move body behind the LRU score cache"""
+        key = (tuple(move.cards), getattr(move, 'combo_type', None), ctx)
+        cache = self._score_cache
+        score = cache.get(key)
+        if score is not None:
+            cache.move_to_end(key)
+            return score
+        
+        score = self._score_move(move, hand, game_state, ctx.game_type, ctx.strategic_score)
+        cache[key] = score
+        if len(cache) > self._SCORE_CACHE_SIZE:
+            cache.popitem(last=False)
+        return score
+    
+    def _score_move(
+        self, 
+        move: Move, 
+        hand: List[Card], 
+        game_state: GameState,
+        game_type: str,
+        strategic_score: Optional[float] = None
+    ) -> float:
+        """Uncached weighted sum of the four sub-evaluators
+        
+        strategic_score may be passed in when already known: it depends only
+        on the hand and game state, not on the move.
+        """
         score = 0.0
         
         # 1. Penalty avoidance (40% weight)
@@ -47,7 +149,8 @@ class MoveEvaluator:
         score += combo_score * 0.2
         
         # 4. Strategic value (15% weight)
-        strategic_score = self._evaluate_strategic_value(move, hand, game_state)
+        if strategic_score is None:
+            strategic_score = self._evaluate_strategic_value(move, hand, game_state)
         score += strategic_score * 0.15
         
         # Ensure minimum score for any valid move
@@ -64,49 +167,63 @@ class MoveEvaluator:
         score = 1.0
         
         # Simulate hand after move
-        remaining_hand = [card for card in hand if card not in move.cards]
+        played = frozenset(move.cards)
+        remaining_hand = [card for card in hand if card not in played]
         
-        # Check penalty risks in remaining hand
-        if game_type == "tlmn":
-            risks = self.penalty_checker.check_tlmn_penalties(remaining_hand, game_state)
-        else:
-            risks = self.penalty_checker.check_sam_penalties(remaining_hand, game_state)
+        # Check penalty risks in remaining hand (they depend on the cards only);
+        # playing out the whole hand leaves nothing to be penalised for
+        penalty_key = (CardMemory.bitboard(remaining_hand), len(remaining_hand), game_type)
+        risks = self._penalty_cache.get(penalty_key) if remaining_hand else ()
+        if risks is None:
+            if game_type == "tlmn":
+                risks = self.penalty_checker.check_tlmn_penalties(remaining_hand, game_state)
+            else:
+                risks = self.penalty_checker.check_sam_penalties(remaining_hand, game_state)
+            if len(self._penalty_cache) >= self._PENALTY_CACHE_SIZE:
+                self._penalty_cache.clear()
+            risks = self._penalty_cache[penalty_key] = tuple(risks)
         
         # Heavy penalty for critical risks
         for risk in risks:
             severity = self.penalty_checker.get_penalty_severity(risk)
-            if severity.value >= 3:  # CRITICAL
-                score -= 0.8
-            elif severity.value >= 2:  # HIGH
-                score -= 0.4
-            elif severity.value >= 1:  # MEDIUM
-                score -= 0.2
+            if severity:
+                score -= _SEVERITY_PENALTY[severity]
         
         # Bonus for getting rid of dangerous cards
-        for card in move.cards:
-            if card.rank == Rank.TWO and card.suit == Suit.SPADES:  # 2♠
-                score += 0.3
-            elif card.rank == Rank.TWO:  # Other 2s
-                score += 0.2
-            elif card.rank.value >= 10:  # High cards
-                score += 0.1
+        score = self._add_dangerous_card_bonus(score, move)
         
         return max(0.0, score)
     
+    @staticmethod
+    def _add_dangerous_card_bonus(score: float, move: Move) -> float:
+        """Add the bonus for dumping 2♠, other 2s and high cards to score
+        
+        Added card by card in move order, so the float result is the same
+        as summing the per-card bonuses one at a time.
+        """
+        bonus_of = _DANGEROUS_CARD_BONUS.get
+        for card in move.cards:
+            bonus = bonus_of(card)
+            if bonus:
+                score += bonus
+        return score
+    
     def _evaluate_card_values(self, move: Move, hand: List[Card]) -> float:
         """Evaluate card value optimization"""
         if not move.cards:
             return 0.0
         
+        rank_values = [card.rank.value for card in move.cards]
+        
         # Prefer getting rid of high-value cards
-        total_value = sum(card.rank.value for card in move.cards)
-        avg_value = total_value / len(move.cards)
+        total_value = sum(rank_values)
+        avg_value = total_value / len(rank_values)
         
         # Invert so lower values score higher (we want to get rid of high cards)
         score = (12 - avg_value) / 12.0
         
         # Bonus for getting rid of multiple high cards
-        high_cards = sum(1 for card in move.cards if card.rank.value >= 8)
+        high_cards = sum(1 for value in rank_values if value >= 8)
         if high_cards > 1:
             score += 0.2
         
@@ -117,20 +234,7 @@ class MoveEvaluator:
         if not hasattr(move, 'combo_type'):
             return 0.5
         
-        # Combo type preferences
-        combo_preferences = {
-            ComboType.SINGLE: 0.3,      # Basic, good for dumping
-            ComboType.PAIR: 0.5,        # Good for clearing pairs
-            ComboType.TRIPLE: 0.7,      # Very good for clearing
-            ComboType.FOUR_KIND: 0.9,   # Excellent, powerful
-            ComboType.STRAIGHT: 0.6,    # Good for clearing multiple
-            ComboType.DOUBLE_SEQ: 0.8,  # Very good for clearing
-            ComboType.THREE_CONSECUTIVE_PAIRS: 0.9,  # Powerful
-            ComboType.FOUR_CONSECUTIVE_PAIRS: 1.0,   # Most powerful
-            ComboType.SPECIAL: 1.0      # Best, rare combos
-        }
-        
-        return combo_preferences.get(move.combo_type, 0.5)
+        return _COMBO_PREFERENCES.get(move.combo_type, 0.5)
     
     def _evaluate_strategic_value(
         self, 
@@ -139,10 +243,14 @@ class MoveEvaluator:
         game_state: GameState
     ) -> float:
         """Evaluate strategic value of the move"""
+        return self._strategic_value_from_sizes(len(hand), tuple(len(p.hand) for p in game_state.players))
+    
+    @staticmethod
+    def _strategic_value_from_sizes(hand_size: int, player_hand_sizes: Tuple[int, ...]) -> float:
+        """Strategic value from own hand size and every player's hand size"""
         score = 0.5  # Base score
         
         # Hand size consideration
-        hand_size = len(hand)
         if hand_size <= 3:
             # Urgent to play when few cards left
             score += 0.3
@@ -150,20 +258,87 @@ class MoveEvaluator:
             score += 0.1
         
         # Opponent hand sizes
-        opponent_hands = [len(p.hand) for p in game_state.players]
-        if opponent_hands:
-            min_opponent_hand = min(opponent_hands)
+        if player_hand_sizes:
+            min_opponent_hand = min(player_hand_sizes)
             if min_opponent_hand <= 2:
                 # Someone is close to winning, play more aggressively
                 score += 0.2
         
         # Game phase consideration
-        total_cards_played = sum(13 - len(p.hand) for p in game_state.players)
+        total_cards_played = 13 * len(player_hand_sizes) - sum(player_hand_sizes)
         if total_cards_played > 30:  # Late game
             score += 0.1
         
         return min(1.0, score)
     
+    def evaluate_moves_batch(
+        self, 
+        moves: List[Move], 
+        hand: List[Card], 
+        game_state: GameState,
+        game_type: str = "tlmn"
+    ) -> List[float]:
+        """
+        Score every candidate move against one hand/game state
+        
+        Equivalent to calling evaluate_move per move, but the hand/game-state
+        context (including the move-independent strategic score) is built once.
+        """
+        if not moves:
+            return []
+        
+        ctx = self._build_context(hand, game_state, game_type)
+        evaluate = self._evaluate_move_cached
+        
+        scores = []
+        for move in moves:
+            if not getattr(move, 'cards', None):
+                scores.append(0.0)
+            else:
+                scores.append(evaluate(move, hand, game_state, ctx))
+        return scores
+    
+    def _score_upper_bound(self, move: Move, hand: List[Card], ctx: _EvalContext) -> float:
+        """Score ceiling without the PenaltyChecker call (assumes no penalty risks)"""
+        bound = (
+            self._add_dangerous_card_bonus(1.0, move) * 0.4
+            + self._evaluate_card_values(move, hand) * 0.25
+            + self._evaluate_combo_efficiency(move) * 0.2
+            + ctx.strategic_score * 0.15
+        )
+        return max(0.1, min(1.0, bound))
+    
+    def get_best_move(
+        self, 
+        moves: List[Move], 
+        hand: List[Card], 
+        game_state: GameState,
+        game_type: str = "tlmn"
+    ) -> Optional[Tuple[Move, float]]:
+        """
+        Top entry of get_move_rankings without fully scoring every move
+        
+        Moves whose penalty-free score ceiling cannot beat the best score so
+        far skip the penalty simulation. Ties resolve to the earlier move, as
+        with the stable sort in get_move_rankings.
+        """
+        if not moves:
+            return None
+        
+        ctx = self._build_context(hand, game_state, game_type)
+        best_move, best_score = None, -1.0
+        for move in moves:
+            if not getattr(move, 'cards', None):
+                score = 0.0
+            elif (best_score >= 1.0
+                  or self._score_upper_bound(move, hand, ctx) < best_score - 1e-9):
+                continue
+            else:
+                score = self._evaluate_move_cached(move, hand, game_state, ctx)
+            if score > best_score:
+                best_move, best_score = move, score
+        return best_move, best_score
+    
     def get_move_rankings(
         self, 
         moves: List[Move], 
@@ -172,13 +347,10 @@ class MoveEvaluator:
         game_type: str = "tlmn"
     ) -> List[tuple[Move, float]]:
         """Get moves ranked by evaluation score"""
-        scored_moves = []
-        
-        for move in moves:
-            score = self.evaluate_move(move, hand, game_state, game_type)
-            scored_moves.append((move, score))
+        scores = self.evaluate_moves_batch(moves, hand, game_state, game_type)
+        scored_moves = list(zip(moves, scores))
         
         # Sort by score (highest first)
-        scored_moves.sort(key=lambda x: x[1], reverse=True)
+        scored_moves.sort(key=itemgetter(1), reverse=True)
         
         return scored_moves
@@ -5,23 +5,57 @@ Extracted from model_build/scripts/unbeatable/unbeatable_sequence_model.py
 
 import numpy as np
 import logging
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional
 
 from ai_common.core.combo_analyzer import ComboAnalyzer
 
 logger = logging.getLogger(__name__)
 
+# Combo types tracked in the type-distribution features; anything else
+# (e.g. double_seq) falls into a trailing "other" bucket that is dropped
+_COMBO_TYPES = ['single', 'pair', 'triple', 'straight', 'four_kind']
+_TYPE_ID = {ct: i for i, ct in enumerate(_COMBO_TYPES)}
+_OTHER_TYPE_ID = len(_COMBO_TYPES)
+
 
 class SequenceFeatureExtractor:
     """Feature extraction utilities for ML models - reusable for training"""
     
     @staticmethod
-    def extract_combo_features(combo: Dict[str, Any]) -> List[float]:
+    def _strength(combo: Dict[str, Any], cache: Optional[Dict[int, float]] = None) -> float:
+        """Combo strength, memoized by combo identity in an optional per-call cache"""
+        if cache is None:
+            return ComboAnalyzer.calculate_combo_strength(combo)
+        key = id(combo)
+        strength = cache.get(key)
+        if strength is None:
+            strength = cache[key] = ComboAnalyzer.calculate_combo_strength(combo)
+        return strength
+    
+    @staticmethod
+    def _strength_and_type_arrays(combos: List[Dict[str, Any]], cache: Optional[Dict[int, float]] = None):
+        """Return (strengths, type_counts) arrays for a non-empty combo list"""
+        n = len(combos)
+        strength = SequenceFeatureExtractor._strength
+        strengths = np.fromiter(
+            (strength(combo, cache) for combo in combos),
+            dtype=np.float64, count=n,
+        )
+        type_ids = np.fromiter(
+            (_TYPE_ID.get(combo['combo_type'], _OTHER_TYPE_ID) for combo in combos),
+            dtype=np.int8, count=n,
+        )
+        type_counts = np.bincount(type_ids, minlength=_OTHER_TYPE_ID + 1)[:_OTHER_TYPE_ID]
+        return strengths, type_counts
+    
+    @staticmethod
+    def extract_combo_features(combo: Dict[str, Any], _cache: Optional[Dict[int, float]] = None) -> List[float]:
         """
         Extract combo-level features for ML models
         
         Args:
             combo: Combo dictionary with combo_type, rank_value, cards
+            _cache: Optional strength cache shared with other extractors
             
         Returns:
             List of normalized feature values
@@ -39,7 +73,7 @@ class SequenceFeatureExtractor:
         features.append(rank_value / 12.0)
         
         # Absolute strength
-        strength = ComboAnalyzer.calculate_combo_strength(combo)
+        strength = SequenceFeatureExtractor._strength(combo, _cache)
         features.append(strength)
         
         # Card count
@@ -49,12 +83,13 @@ class SequenceFeatureExtractor:
         return features
     
     @staticmethod
-    def extract_sequence_features(combos: List[Dict[str, Any]]) -> List[float]:
+    def extract_sequence_features(combos: List[Dict[str, Any]], _cache: Optional[Dict[int, float]] = None) -> List[float]:
         """
         Extract sequence-level features for ML models
         
         Args:
             combos: List of combo dictionaries
+            _cache: Optional strength cache shared with other extractors
             
         Returns:
             List of normalized feature values
@@ -62,24 +97,21 @@ class SequenceFeatureExtractor:
         if not combos:
             return [0.0] * 10
         
-        strengths = [ComboAnalyzer.calculate_combo_strength(combo) for combo in combos]
+        strengths, type_counts = SequenceFeatureExtractor._strength_and_type_arrays(combos, _cache)
+        total_combos = len(combos)
         
         features = []
         
         # Strength distribution
         features.append(np.mean(strengths))  # avg_strength
         features.append(np.var(strengths))   # strength_variance
-        features.append(max(strengths) - min(strengths))  # strength_range
+        features.append(np.ptp(strengths))   # strength_range
         
         # Combo distribution
-        combo_types = ['single', 'pair', 'triple', 'straight', 'four_kind']
-        type_counts = [sum(1 for c in combos if c['combo_type'] == ct) for ct in combo_types]
-        total_combos = len(combos)
-        type_distribution = [count / total_combos for count in type_counts]
-        features.extend(type_distribution)
+        features.extend((type_counts / total_combos).tolist())
         
         # Power indicators
-        power_combo_ratio = sum(1 for s in strengths if s >= 0.8) / len(strengths)
+        power_combo_ratio = int(np.count_nonzero(strengths >= 0.8)) / total_combos
         features.append(power_combo_ratio)
         
         # Coverage efficiency
@@ -89,12 +121,13 @@ class SequenceFeatureExtractor:
         return features
     
     @staticmethod
-    def extract_pattern_features(hand_data: Dict[str, Any]) -> List[float]:
+    def extract_pattern_features(hand_data: Dict[str, Any], _cache: Optional[Dict[int, float]] = None) -> List[float]:
         """
         Extract features for pattern learning
         
         Args:
             hand_data: Dictionary with hand, player_count, possible_combos
+            _cache: Optional strength cache shared with other extractors
             
         Returns:
             List of normalized feature values
@@ -104,93 +137,92 @@ class SequenceFeatureExtractor:
         if not combos:
             return [0.0] * 15
         
-        strengths = [ComboAnalyzer.calculate_combo_strength(combo) for combo in combos]
-        
-        features = []
+        strengths, type_counts = SequenceFeatureExtractor._strength_and_type_arrays(combos, _cache)
+        total_combos = len(combos)
         
-        # Combo diversity
-        combo_types = set(combo['combo_type'] for combo in combos)
-        combo_diversity = len(combo_types) / 5.0  # Max 5 types
-        features.append(combo_diversity)
+        # Combo diversity (distinct types; untracked ones are only scanned if present)
+        distinct_types = int(np.count_nonzero(type_counts))
+        if int(type_counts.sum()) < total_combos:
+            distinct_types += len({c['combo_type'] for c in combos if c['combo_type'] not in _TYPE_ID})
+        combo_diversity = distinct_types / 5.0  # Max 5 types
         
         # Power concentration
-        power_combos = sum(1 for s in strengths if s >= 0.8)
-        power_concentration = power_combos / len(combos)
-        features.append(power_concentration)
+        power_combos = int(np.count_nonzero(strengths >= 0.8))
+        power_concentration = power_combos / total_combos
         
         # Balance preference
         strength_variance = np.var(strengths)
-        features.append(strength_variance)
         
         # Type preferences
-        combo_types_list = ['single', 'pair', 'triple', 'straight', 'four_kind']
-        type_counts = [sum(1 for c in combos if c['combo_type'] == ct) for ct in combo_types_list]
-        total_combos = len(combos)
-        type_prefs = [count / total_combos for count in type_counts]
-        features.extend(type_prefs)
-        
-        # Strength distribution
-        features.extend([
-            np.mean(strengths),
-            np.max(strengths),
-            np.min(strengths),
-            np.median(strengths)
-        ])
+        type_prefs = (type_counts / total_combos).tolist()
         
-        # Additional pattern signals to reach 15 features
-        # Ratio of singles and pairs (indicates weakness pattern)
-        singles_ratio = sum(1 for c in combos if c['combo_type'] == 'single') / total_combos
-        pairs_ratio = sum(1 for c in combos if c['combo_type'] == 'pair') / total_combos
-        features.extend([singles_ratio, pairs_ratio])
+        # Strength distribution (min/max/median read off one sort)
+        ordered = np.sort(strengths)
+        mid = total_combos // 2
+        median = ordered[mid] if total_combos % 2 else (ordered[mid - 1] + ordered[mid]) / 2.0
         
         # Context
         player_count = hand_data.get('player_count', 4)
-        features.append(player_count / 4.0)
         
-        return features
+        # Built in one literal (15 features); the trailing singles/pairs
+        # ratios (weakness pattern) are type_prefs[0] and type_prefs[1]
+        return [
+            combo_diversity,
+            power_concentration,
+            strength_variance,
+            *type_prefs,
+            np.mean(strengths),
+            ordered[-1],
+            ordered[0],
+            median,
+            type_prefs[0],
+            type_prefs[1],
+            player_count / 4.0,
+        ]
     
     @staticmethod
-    def extract_validation_features(hand_data: Dict[str, Any]) -> List[float]:
+    def extract_validation_features(hand_data: Dict[str, Any], _cache: Optional[Dict[int, float]] = None) -> List[float]:
         """
         Extract all features for validation model
         
         Args:
             hand_data: Dictionary with hand, player_count, possible_combos
+            _cache: Optional strength cache shared with other extractors
             
         Returns:
             List of normalized feature values
         """
         combos = hand_data.get('possible_combos', [])
+        if _cache is None:
+            _cache = {}
         
-        features = []
+        # 10 sequence + 3 x 8 combo + 1 context features; missing combos stay zero-padded
+        features = [0.0] * 35
         
         # Sequence-level features
-        seq_features = SequenceFeatureExtractor.extract_sequence_features(combos)
-        features.extend(seq_features)
+        features[0:10] = SequenceFeatureExtractor.extract_sequence_features(combos, _cache)
         
         # First 3 combo features
-        for i in range(3):
-            if i < len(combos):
-                combo_features = SequenceFeatureExtractor.extract_combo_features(combos[i])
-                features.extend(combo_features)
-            else:
-                # Pad with zeros
-                features.extend([0.0] * 8)  # 8 combo features
+        for i, combo in enumerate(combos[:3]):
+            start = 10 + 8 * i
+            features[start:start + 8] = SequenceFeatureExtractor.extract_combo_features(combo, _cache)
         
         # Context features
         player_count = hand_data.get('player_count', 4)
-        features.append(player_count / 4.0)  # Normalize
+        features[34] = player_count / 4.0  # Normalize
         
         return features
     
     @staticmethod
-    def extract_threshold_features(hand_data: Dict[str, Any], user_patterns: Dict[str, Any]) -> List[float]:
+    def extract_threshold_features(hand_data: Dict[str, Any], user_patterns: Dict[str, Any],
+                                   _cache: Optional[Dict[int, float]] = None) -> List[float]:
         """
         Extract features for threshold learning
         
         Args:
             hand_data: Dictionary with hand, player_count, possible_combos
             user_patterns: Dictionary with user pattern information
+            _cache: Optional strength cache shared with other extractors
             
         Returns:
             List of normalized feature values
@@ -200,13 +232,17 @@ class SequenceFeatureExtractor:
         # Hand characteristics
         combos = hand_data.get('possible_combos', [])
         if combos:
-            strengths = [ComboAnalyzer.calculate_combo_strength(combo) for combo in combos]
+            strength = SequenceFeatureExtractor._strength
+            strengths = np.fromiter(
+                (strength(combo, _cache) for combo in combos),
+                dtype=np.float64, count=len(combos),
+            )
             
             features.extend([
-                np.mean(strengths),
-                np.max(strengths),
+                strengths.mean(),
+                strengths.max(),
                 len(combos),
-                sum(1 for s in strengths if s >= 0.8)  # unbeatable combos
+                int(np.count_nonzero(strengths >= 0.8))  # unbeatable combos
             ])
         else:
             features.extend([0.0, 0.0, 0.0, 0.0])
@@ -224,3 +260,24 @@ class SequenceFeatureExtractor:
         features.append(player_count / 4.0)
         
         return features
+    
+    @staticmethod
+    def extract_all(hand_data: Dict[str, Any], user_patterns: Dict[str, Any]) -> Dict[str, List[float]]:
+        """
+        Extract every feature set for one hand, computing each combo strength once
+        
+        Args:
+            hand_data: Dictionary with hand, player_count, possible_combos
+            user_patterns: Dictionary with user pattern information
+            
+        Returns:
+            Dict with sequence, pattern, validation and threshold feature lists
+        """
+        cache: Dict[int, float] = {}
+        combos = hand_data.get('possible_combos', [])
+        return {
+            'sequence': SequenceFeatureExtractor.extract_sequence_features(combos, cache),
+            'pattern': SequenceFeatureExtractor.extract_pattern_features(hand_data, cache),
+            'validation': SequenceFeatureExtractor.extract_validation_features(hand_data, cache),
+            'threshold': SequenceFeatureExtractor.extract_threshold_features(hand_data, user_patterns, cache),
+        }
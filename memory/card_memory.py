@@ -2,35 +2,116 @@
 Card Memory System - Advanced card counting and game memory
 """
 
-from typing import List, Dict, Set, Optional
+from collections import Counter
+from functools import lru_cache
+from typing import List, Dict, Set, FrozenSet, Optional
 from game_engine.core.card_encoding import Card, Rank, Suit
 from game_engine.core.game_entities import GameState, Move
 
 
+_CARDS = [Card.from_id(card_id) for card_id in range(52)]
+
+
+def _build_card_tables():
+    """Build card <-> bit lookups and per-rank/per-suit masks over card ids 0-51"""
+    cards = _CARDS
+    card_bits = {card: 1 << card_id for card_id, card in enumerate(cards)}
+    rank_masks: Dict[Rank, int] = {}
+    suit_masks: Dict[Suit, int] = {}
+    for card, bit in card_bits.items():
+        rank_masks[card.rank] = rank_masks.get(card.rank, 0) | bit
+        suit_masks[card.suit] = suit_masks.get(card.suit, 0) | bit
+    return cards, card_bits, rank_masks, suit_masks
+
+
+@lru_cache(maxsize=128)
+def _cards_of_bitboard(bb: int) -> FrozenSet[Card]:
+    """Read-only set of the cards whose bits are set in bb"""
+    cards = []
+    while bb:
+        low = bb & -bb
+        cards.append(_CARDS[low.bit_length() - 1])
+        bb ^= low
+    return frozenset(cards)
+
+
 class CardMemory:
-    """Advanced card counting and memory system"""
+    """Advanced card counting and memory system
+
+    Played/remaining cards are kept as 52-bit bitboards (bit i = card id i),
+    so rank/suit counts are a mask and a popcount instead of a set scan.
+    played_cards and remaining_cards are read-only frozenset views of the
+    bitboards: they used to be mutable sets, and code that added to or
+    discarded from them must now go through update_with_move.
+    Cards outside the 52-card deck raise ValueError.
+    """
+
+    _CARDS, _CARD_BITS, _RANK_MASKS, _SUIT_MASKS = _build_card_tables()
+    _FULL_DECK_BB = (1 << 52) - 1
+    # J-2 for opponent estimates; K-2 (critical cards) for strategic insights
+    _HIGH_MASK = sum(mask for rank, mask in _RANK_MASKS.items() if rank.value >= 8)
+    _CRITICAL_MASK = sum(
+        mask for rank, mask in _RANK_MASKS.items() if rank == Rank.TWO or rank.value >= 10
+    )
     
     def __init__(self):
         self.reset()
     
+    @classmethod
+    def bitboard(cls, cards: List[Card]) -> int:
+        """52-bit mask of the given cards (bit i = card id i)"""
+        card_bits = cls._CARD_BITS
+        bb = 0
+        for card in cards:
+            bit = card_bits.get(card)
+            if bit is None:
+                raise ValueError(f"Unknown card: {card!r}")
+            bb |= bit
+        return bb
+    
     def reset(self):
         """Reset memory for new game"""
-        self.played_cards: Set[Card] = set()
-        self.remaining_cards: Set[Card] = set()
+        self.played_bb: int = 0
+        self.remaining_bb: int = self._FULL_DECK_BB
         self.player_hands: Dict[int, Set[Card]] = {}
         self.move_history: List[Dict] = []
-        
-        # Initialize with all 52 cards
-        for card_id in range(52):
-            card = Card.from_id(card_id)
-            self.remaining_cards.add(card)
+        # Column view of move_history for the aggregate queries: one entry
+        # per move, combo type value / average rank value or None if absent
+        self._history_player_ids: List[int] = []
+        self._history_combo_types: List[Optional[object]] = []
+        self._history_avg_values: List[Optional[float]] = []
+    
+    @staticmethod
+    def _iter_bits(bb: int):
+        """Yield the card ids whose bits are set in bb, lowest first"""
+        while bb:
+            low = bb & -bb
+            yield low.bit_length() - 1
+            bb ^= low
+    
+    @property
+    def played_cards(self) -> FrozenSet[Card]:
+        """Read-only view of played cards (cached per bitboard)"""
+        return _cards_of_bitboard(self.played_bb)
+    
+    @property
+    def remaining_cards(self) -> FrozenSet[Card]:
+        """Read-only view of remaining cards (cached per bitboard)"""
+        return _cards_of_bitboard(self.remaining_bb)
     
     def update_with_move(self, player_id: int, move: Move, game_state: GameState):
         """Update memory with a new move"""
+        avg_value = None
         if hasattr(move, 'cards') and move.cards:
-            for card in move.cards:
-                self.played_cards.add(card)
-                self.remaining_cards.discard(card)
+            move_bb = self.bitboard(move.cards)
+            self.played_bb |= move_bb
+            self.remaining_bb &= ~move_bb
+            avg_value = sum(card.rank.value for card in move.cards) / len(move.cards)
+        
+        combo_type = getattr(move, 'combo_type', None)
+        self._history_player_ids.append(player_id)
+        self._history_combo_types.append(combo_type.value if combo_type is not None else None)
+        self._history_avg_values.append(avg_value)
         
         # Update move history
         move_record = {
@@ -43,40 +124,48 @@ class CardMemory:
     
     def get_remaining_cards(self) -> Set[Card]:
         """Get all remaining unplayed cards"""
-        return self.remaining_cards.copy()
+        return set(_cards_of_bitboard(self.remaining_bb))
     
     def get_played_cards(self) -> Set[Card]:
         """Get all played cards"""
-        return self.played_cards.copy()
+        return set(_cards_of_bitboard(self.played_bb))
+    
+    def get_remaining_count(self) -> int:
+        """Number of remaining unplayed cards (no set is built)"""
+        return bin(self.remaining_bb).count("1")
+    
+    def get_played_count(self) -> int:
+        """Number of played cards (no set is built)"""
+        return bin(self.played_bb).count("1")
     
     def get_remaining_count_by_rank(self, rank: Rank) -> int:
         """Get count of remaining cards of a specific rank"""
-        return sum(1 for card in self.remaining_cards if card.rank == rank)
+        return bin(self.remaining_bb & self._RANK_MASKS[rank]).count("1")
     
     def get_remaining_count_by_suit(self, suit: Suit) -> int:
         """Get count of remaining cards of a specific suit"""
-        return sum(1 for card in self.remaining_cards if card.suit == suit)
+        return bin(self.remaining_bb & self._SUIT_MASKS[suit]).count("1")
     
     def get_played_count_by_rank(self, rank: Rank) -> int:
         """Get count of played cards of a specific rank"""
-        return sum(1 for card in self.played_cards if card.rank == rank)
+        return bin(self.played_bb & self._RANK_MASKS[rank]).count("1")
     
     def get_played_count_by_suit(self, suit: Suit) -> int:
         """Get count of played cards of a specific suit"""
-        return sum(1 for card in self.played_cards if card.suit == suit)
+        return bin(self.played_bb & self._SUIT_MASKS[suit]).count("1")
     
     def is_card_played(self, card: Card) -> bool:
         """Check if a specific card has been played"""
-        return card in self.played_cards
+        return bool(self.played_bb & self._CARD_BITS.get(card, 0))
     
     def is_card_remaining(self, card: Card) -> bool:
         """Check if a specific card is still remaining"""
-        return card in self.remaining_cards
+        return bool(self.remaining_bb & self._CARD_BITS.get(card, 0))
     
     def get_probability_of_rank(self, rank: Rank) -> float:
         """Get probability that a specific rank is still available"""
         remaining = self.get_remaining_count_by_rank(rank)
-        total_remaining = len(self.remaining_cards)
+        total_remaining = self.get_remaining_count()
         
         if total_remaining == 0:
             return 0.0
@@ -86,7 +175,7 @@ class CardMemory:
     def get_probability_of_suit(self, suit: Suit) -> float:
         """Get probability that a specific suit is still available"""
         remaining = self.get_remaining_count_by_suit(suit)
-        total_remaining = len(self.remaining_cards)
+        total_remaining = self.get_remaining_count()
         
         if total_remaining == 0:
             return 0.0
@@ -103,15 +192,16 @@ class CardMemory:
         }
         
         # Calculate probabilities based on remaining cards
-        remaining = self.get_remaining_cards()
+        remaining_bb = self.remaining_bb
+        total_remaining = bin(remaining_bb).count("1")
         
         # High cards (J, Q, K, A, 2)
-        high_cards_remaining = sum(1 for card in remaining if card.rank.value >= 8)
-        estimate["high_cards_probability"] = high_cards_remaining / len(remaining) if remaining else 0
+        high_cards_remaining = bin(remaining_bb & self._HIGH_MASK).count("1")
+        estimate["high_cards_probability"] = high_cards_remaining / total_remaining if total_remaining else 0
         
         # Dangerous cards (2♠, other 2s)
-        dangerous_cards_remaining = sum(1 for card in remaining if card.rank == Rank.TWO)
-        estimate["dangerous_cards_probability"] = dangerous_cards_remaining / len(remaining) if remaining else 0
+        dangerous_cards_remaining = bin(remaining_bb & self._RANK_MASKS[Rank.TWO]).count("1")
+        estimate["dangerous_cards_probability"] = dangerous_cards_remaining / total_remaining if total_remaining else 0
         
         return estimate
     
@@ -122,21 +212,12 @@ class CardMemory:
         
         stats = {
             "total_moves": len(self.move_history),
-            "moves_by_player": {},
-            "combo_types": {},
+            # Count moves by player and combo type (first-seen key order)
+            "moves_by_player": dict(Counter(self._history_player_ids)),
+            "combo_types": dict(Counter(ct for ct in self._history_combo_types if ct is not None)),
             "cards_played_per_turn": []
         }
         
-        # Count moves by player
-        for move_record in self.move_history:
-            player_id = move_record["player_id"]
-            stats["moves_by_player"][player_id] = stats["moves_by_player"].get(player_id, 0) + 1
-            
-            # Count combo types
-            if hasattr(move_record["move"], 'combo_type'):
-                combo_type = move_record["move"].combo_type.value
-                stats["combo_types"][combo_type] = stats["combo_types"].get(combo_type, 0) + 1
-        
         return stats
     
     def get_strategic_insights(self) -> Dict[str, any]:
@@ -148,20 +229,21 @@ class CardMemory:
             "opponent_patterns": {}
         }
         
-        remaining = self.get_remaining_cards()
-        
-        # Critical cards (2♠, other 2s, high cards)
-        for card in remaining:
+        # Critical cards (2♠, other 2s, high cards) in card order, as the
+        # remaining set was walked; only qualifying bits are visited
+        critical = insights["critical_cards_remaining"]
+        cards = self._CARDS
+        for card_id in self._iter_bits(self.remaining_bb & self._CRITICAL_MASK):
+            card = cards[card_id]
             if card.rank == Rank.TWO and card.suit == Suit.SPADES:
-                insights["critical_cards_remaining"].append("2♠")
+                critical.append("2♠")
             elif card.rank == Rank.TWO:
-                insights["critical_cards_remaining"].append(f"2{card.suit.name[0]}")
-            elif card.rank.value >= 10:
-                insights["critical_cards_remaining"].append(str(card))
+                critical.append(f"2{card.suit.name[0]}")
+            else:
+                critical.append(str(card))
         
         # Analyze opponent patterns
-        for move_record in self.move_history:
-            player_id = move_record["player_id"]
+        for player_id, avg_value in zip(self._history_player_ids, self._history_avg_values):
             if player_id not in insights["opponent_patterns"]:
                 insights["opponent_patterns"][player_id] = {
                     "aggressive_moves": 0,
@@ -170,8 +252,7 @@ class CardMemory:
                 }
             
             # Analyze move patterns (simplified)
-            if hasattr(move_record["move"], 'cards') and move_record["move"].cards:
-                avg_value = sum(card.rank.value for card in move_record["move"].cards) / len(move_record["move"].cards)
+            if avg_value is not None:
                 if avg_value >= 6:  # High cards
                     insights["opponent_patterns"][player_id]["aggressive_moves"] += 1
                 else:
@@ -9,30 +9,72 @@ from game_engine.core.combo_validator import ComboValidator, ComboType
 from .penalty_types import PenaltyRisk, PenaltySeverity
 
 
+def _build_nibble_bits() -> Dict[Card, int]:
+    """Card -> bit (4 * rank value + suit index) for the nibble-per-rank hand mask"""
+    suit_index = {suit: i for i, suit in enumerate(Suit)}
+    nibble_bits = {}
+    for card_id in range(52):
+        card = Card.from_id(card_id)
+        nibble_bits[card] = 1 << (card.rank.value * 4 + suit_index[card.suit])
+    return nibble_bits
+
+
+_NIBBLE_BITS = _build_nibble_bits()
+_TWO_SPADES_BIT = next(
+    bit for card, bit in _NIBBLE_BITS.items() if card.rank == Rank.TWO and card.suit == Suit.SPADES
+)
+_NIBBLE_LOW = 0x1111111111111  # bit 0 of each of the 13 rank nibbles
+_SWAR_M1 = 0x5555555555555
+_SWAR_M2 = 0x3333333333333
+
+
+def _build_severity_table(critical) -> tuple:
+    """Severity per risk, indexed by the PenaltyRisk int value"""
+    table = [PenaltySeverity.LOW] * (max(PenaltyRisk) + 1)
+    for risk in critical:
+        table[risk] = PenaltySeverity.CRITICAL
+    return tuple(table)
+
+
 class PenaltyChecker:
     """Common penalty avoidance logic for all AI"""
     
+    _CRITICAL_PENALTIES = frozenset({
+        PenaltyRisk.THOI_2_SPADES,
+        PenaltyRisk.THOI_FOUR_KIND,
+        PenaltyRisk.THOI_THREE_PAIRS,
+        PenaltyRisk.THOI_FOUR_PAIRS,
+        PenaltyRisk.THOI_2_SPADES_SAM,
+        PenaltyRisk.THOI_FOUR_KIND_SAM,
+        PenaltyRisk.CONG,
+        PenaltyRisk.PHAT_SAM
+    })
+    _SEVERITY_BY_RISK = _build_severity_table(_CRITICAL_PENALTIES)
+    
     def __init__(self):
         self.combo_validator = ComboValidator()
     
     def check_tlmn_penalties(self, hand: List[Card], game_state: GameState) -> List[PenaltyRisk]:
         """Check TLMN penalty risks"""
         risks = []
+        hand_mask = self._hand_mask(hand)
+        pair_mask, quad_mask = self._pair_and_quad_masks(hand_mask)
         
         # Check for 2♠ (highest penalty risk)
-        if self._has_2_spades(hand):
+        if self._has_2_spades(hand_mask):
             risks.append(PenaltyRisk.THOI_2_SPADES)
         
         # Check for four of a kind
-        if self._has_four_of_kind(hand):
+        if self._has_four_of_kind(quad_mask):
             risks.append(PenaltyRisk.THOI_FOUR_KIND)
         
         # Check for 3 đôi thông
-        if self._has_three_consecutive_pairs(hand):
+        has_three_pairs = self._has_three_consecutive_pairs(pair_mask)
+        if has_three_pairs:
             risks.append(PenaltyRisk.THOI_THREE_PAIRS)
         
-        # Check for 4 đôi thông
-        if self._has_four_consecutive_pairs(hand):
+        # Check for 4 đôi thông (impossible without 3 đôi thông)
+        if has_three_pairs and self._has_four_consecutive_pairs(pair_mask):
             risks.append(PenaltyRisk.THOI_FOUR_PAIRS)
         
         return risks
@@ -40,13 +82,14 @@ class PenaltyChecker:
     def check_sam_penalties(self, hand: List[Card], game_state: GameState) -> List[PenaltyRisk]:
         """Check Sam penalty risks"""
         risks = []
+        hand_mask = self._hand_mask(hand)
         
         # Check for 2♠
-        if self._has_2_spades(hand):
+        if self._has_2_spades(hand_mask):
             risks.append(PenaltyRisk.THOI_2_SPADES_SAM)
         
         # Check for four of a kind
-        if self._has_four_of_kind(hand):
+        if self._has_four_of_kind(self._pair_and_quad_masks(hand_mask)[1]):
             risks.append(PenaltyRisk.THOI_FOUR_KIND_SAM)
         
         # Check for Cóng risk
@@ -55,54 +98,41 @@ class PenaltyChecker:
         
         return risks
     
-    def _has_2_spades(self, hand: List[Card]) -> bool:
-        """Check if hand contains 2♠"""
-        return any(card.rank == Rank.TWO and card.suit == Suit.SPADES for card in hand)
-    
-    def _has_four_of_kind(self, hand: List[Card]) -> bool:
-        """Check if hand contains four of a kind"""
-        rank_counts = {}
+    def _hand_mask(self, hand: List[Card]) -> int:
+        """52-bit hand mask with one 4-bit nibble per rank (bit = suit)"""
+        nibble_bits = _NIBBLE_BITS
+        mask = 0
         for card in hand:
-            rank_counts[card.rank] = rank_counts.get(card.rank, 0) + 1
-        
-        return any(count >= 4 for count in rank_counts.values())
+            mask |= nibble_bits[card]
+        return mask
     
-    def _has_three_consecutive_pairs(self, hand: List[Card]) -> bool:
-        """Check if hand contains 3 đôi thông"""
-        rank_counts = {}
-        for card in hand:
-            rank_counts[card.rank] = rank_counts.get(card.rank, 0) + 1
-        
-        # Find pairs (at least 2 cards of same rank)
-        pairs = [rank for rank, count in rank_counts.items() if count >= 2]
-        pairs.sort(key=lambda r: r.value)
-        
-        # Check for 3 consecutive pairs
-        for i in range(len(pairs) - 2):
-            if (pairs[i+1].value == pairs[i].value + 1 and 
-                pairs[i+2].value == pairs[i].value + 2):
-                return True
-        
-        return False
+    def _pair_and_quad_masks(self, hand_mask: int):
+        """Per-rank flags (bit 4*rank) for ranks held 2+ times and 4 times
+        
+        SWAR popcount of every nibble at once: after two steps each nibble
+        holds its card count 0-4, so bit 1|2 means a pair and bit 2 a quad.
+        """
+        counts = hand_mask - ((hand_mask >> 1) & _SWAR_M1)
+        counts = (counts & _SWAR_M2) + ((counts >> 2) & _SWAR_M2)
+        pair_mask = ((counts >> 1) | (counts >> 2)) & _NIBBLE_LOW
+        quad_mask = (counts >> 2) & _NIBBLE_LOW
+        return pair_mask, quad_mask
     
-    def _has_four_consecutive_pairs(self, hand: List[Card]) -> bool:
-        """Check if hand contains 4 đôi thông"""
-        rank_counts = {}
-        for card in hand:
-            rank_counts[card.rank] = rank_counts.get(card.rank, 0) + 1
-        
-        # Find pairs
-        pairs = [rank for rank, count in rank_counts.items() if count >= 2]
-        pairs.sort(key=lambda r: r.value)
-        
-        # Check for 4 consecutive pairs
-        for i in range(len(pairs) - 3):
-            if (pairs[i+1].value == pairs[i].value + 1 and 
-                pairs[i+2].value == pairs[i].value + 2 and
-                pairs[i+3].value == pairs[i].value + 3):
-                return True
-        
-        return False
+    def _has_2_spades(self, hand_mask: int) -> bool:
+        """Check if hand mask contains 2♠"""
+        return bool(hand_mask & _TWO_SPADES_BIT)
+    
+    def _has_four_of_kind(self, quad_mask: int) -> bool:
+        """Check if any rank is held four times"""
+        return bool(quad_mask)
+    
+    def _has_three_consecutive_pairs(self, pair_mask: int) -> bool:
+        """Check if pair flags contain 3 đôi thông"""
+        return bool(pair_mask & (pair_mask >> 4) & (pair_mask >> 8))
+    
+    def _has_four_consecutive_pairs(self, pair_mask: int) -> bool:
+        """Check if pair flags contain 4 đôi thông"""
+        return bool(pair_mask & (pair_mask >> 4) & (pair_mask >> 8) & (pair_mask >> 12))
     
     def _risk_of_cong(self, hand: List[Card], game_state: GameState) -> bool:
         """Check if there's risk of Cóng (can't play any card)"""
@@ -112,18 +142,4 @@ class PenaltyChecker:
     
     def get_penalty_severity(self, risk: PenaltyRisk) -> PenaltySeverity:
         """Get the severity of a penalty risk"""
-        critical_penalties = {
-            PenaltyRisk.THOI_2_SPADES,
-            PenaltyRisk.THOI_FOUR_KIND,
-            PenaltyRisk.THOI_THREE_PAIRS,
-            PenaltyRisk.THOI_FOUR_PAIRS,
-            PenaltyRisk.THOI_2_SPADES_SAM,
-            PenaltyRisk.THOI_FOUR_KIND_SAM,
-            PenaltyRisk.CONG,
-            PenaltyRisk.PHAT_SAM
-        }
-        
-        if risk in critical_penalties:
-            return PenaltySeverity.CRITICAL
-        else:
-            return PenaltySeverity.LOW
+        return self._SEVERITY_BY_RISK[risk]
@@ -2,32 +2,73 @@
 Penalty Types - Enumeration of penalty risks
 """
 
-from enum import Enum
+from enum import IntEnum
 
 
-class PenaltyRisk(Enum):
-    """Types of penalty risks in Vietnamese card games"""
+class PenaltyRisk(IntEnum):
+    """Types of penalty risks in Vietnamese card games
+    
+    Integer-valued so risks compare as ints and can index per-risk tables;
+    the original string identifiers are available as .label and map back
+    through from_label (PenaltyRisk("thoi_2_spades") still resolves too)
+    """
     
     # TLMN Penalties
-    THOI_2_SPADES = "thoi_2_spades"           # Thối 2♠ (-26 bets)
-    THOI_FOUR_KIND = "thoi_four_kind"         # Thối tứ quý (-26 bets)
-    THOI_THREE_PAIRS = "thoi_three_pairs"     # Thối 3 đôi thông (-26 bets)
-    THOI_FOUR_PAIRS = "thoi_four_pairs"       # Thối 4 đôi thông (-26 bets)
+    THOI_2_SPADES = 1                         # Thối 2♠ (-26 bets)
+    THOI_FOUR_KIND = 2                        # Thối tứ quý (-26 bets)
+    THOI_THREE_PAIRS = 3                      # Thối 3 đôi thông (-26 bets)
+    THOI_FOUR_PAIRS = 4                       # Thối 4 đôi thông (-26 bets)
     
     # Sam Penalties
-    THOI_2_SPADES_SAM = "thoi_2_spades_sam"   # Thối 2♠ in Sam (-26 bets)
-    THOI_FOUR_KIND_SAM = "thoi_four_kind_sam" # Thối tứ quý in Sam (-26 bets)
-    CONG = "cong"                             # Cóng - can't play any card (-26 bets)
-    PHAT_SAM = "phat_sam"                     # Phạt Sâm - declared but didn't win (-26 bets)
+    THOI_2_SPADES_SAM = 5                     # Thối 2♠ in Sam (-26 bets)
+    THOI_FOUR_KIND_SAM = 6                    # Thối tứ quý in Sam (-26 bets)
+    CONG = 7                                  # Cóng - can't play any card (-26 bets)
+    PHAT_SAM = 8                              # Phạt Sâm - declared but didn't win (-26 bets)
     
     # General Risks
-    HIGH_CARD_RISK = "high_card_risk"         # Risk of being left with high cards
-    COMBO_BREAK_RISK = "combo_break_risk"     # Risk of breaking good combinations
+    HIGH_CARD_RISK = 9                        # Risk of being left with high cards
+    COMBO_BREAK_RISK = 10                     # Risk of breaking good combinations
+    
+    @property
+    def label(self) -> str:
+        """Original string identifier, e.g. thoi_2_spades"""
+        return _LABELS[self]
+    
+    @classmethod
+    def from_label(cls, label: str) -> 'PenaltyRisk':
+        """Risk for an original string identifier (e.g. a serialized risk)"""
+        try:
+            return _BY_LABEL[label]
+        except KeyError:
+            raise ValueError(f"{label!r} is not a valid {cls.__name__} label") from None
+    
+    @classmethod
+    def _missing_(cls, value):
+        # Keep PenaltyRisk("thoi_2_spades") working for string identifiers
+        if isinstance(value, str):
+            return _BY_LABEL.get(value)
+        return None
 
 
-class PenaltySeverity(Enum):
+class PenaltySeverity(IntEnum):
     """Severity levels of penalties"""
     CRITICAL = 3    # -26 bets (must avoid at all costs)
     HIGH = 2        # -13 bets
     MEDIUM = 1      # -6 bets
     LOW = 0         # -1 bet
+
+
+# Original string identifiers of the risks
+_LABELS = {
+    PenaltyRisk.THOI_2_SPADES: "thoi_2_spades",
+    PenaltyRisk.THOI_FOUR_KIND: "thoi_four_kind",
+    PenaltyRisk.THOI_THREE_PAIRS: "thoi_three_pairs",
+    PenaltyRisk.THOI_FOUR_PAIRS: "thoi_four_pairs",
+    PenaltyRisk.THOI_2_SPADES_SAM: "thoi_2_spades_sam",
+    PenaltyRisk.THOI_FOUR_KIND_SAM: "thoi_four_kind_sam",
+    PenaltyRisk.CONG: "cong",
+    PenaltyRisk.PHAT_SAM: "phat_sam",
+    PenaltyRisk.HIGH_CARD_RISK: "high_card_risk",
+    PenaltyRisk.COMBO_BREAK_RISK: "combo_break_risk",
+}
+_BY_LABEL = {label: risk for risk, label in _LABELS.items()}
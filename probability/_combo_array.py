@@ -0,0 +1,39 @@
+"""
+Structure-of-arrays view over a combo list
+Internal to UnbeatableProbabilityCalculator: lets several strength
+reductions share one pass over the combo dicts
+"""
+
+from dataclasses import dataclass
+from typing import List, Dict, Any
+
+import numpy as np
+
+from ai_common.core.combo_analyzer import ComboAnalyzer
+
+
+@dataclass(frozen=True)
+class ComboArray:
+    """Parallel arrays for a combo list: combo strength and card count per combo"""
+    strength: np.ndarray
+    n_cards: np.ndarray
+
+    @classmethod
+    def from_list(cls, combos: List[Dict[str, Any]]) -> 'ComboArray':
+        """Build the arrays in a single pass over the combo dicts"""
+        n = len(combos)
+        strength = np.empty(n, dtype=np.float64)
+        n_cards = np.empty(n, dtype=np.int64)
+        combo_strength = ComboAnalyzer.calculate_combo_strength
+        for i, combo in enumerate(combos):
+            strength[i] = combo_strength(combo)
+            n_cards[i] = len(combo.get('cards', []))
+        return cls(strength=strength, n_cards=n_cards)
+
+    def __len__(self) -> int:
+        return len(self.strength)
+
+    @property
+    def total_cards(self) -> int:
+        return int(self.n_cards.sum())
+
@@ -5,12 +5,19 @@ Extracted from model_build/scripts/unbeatable/unbeatable_sequence_model.py
 
 import numpy as np
 import logging
+from math import fsum
 from typing import List, Dict, Any
 
 from ai_common.core.combo_analyzer import ComboAnalyzer
+from ai_common.probability._combo_array import ComboArray
 
 logger = logging.getLogger(__name__)
 
+# Bucket edges for strength_distribution: very_weak < 0.3 <= weak < 0.5
+# <= medium < 0.7 <= strong < 0.8 <= unbeatable
+_DISTRIBUTION_EDGES = np.array([0.3, 0.5, 0.7, 0.8])
+_DISTRIBUTION_KEYS = ('very_weak', 'weak', 'medium', 'strong', 'unbeatable')
+
 
 class UnbeatableProbabilityCalculator:
     """Calculate unbeatable probabilities and model confidence - reusable for evaluation"""
@@ -40,7 +47,8 @@ class UnbeatableProbabilityCalculator:
             return 1.0
         
         # Tính unbeatable strength của tất cả combo (cho Báo Sâm logic)
-        strengths = [ComboAnalyzer.calculate_unbeatable_strength(combo) for combo in sequence]
+        unbeatable_strength = ComboAnalyzer.calculate_unbeatable_strength
+        strengths = [unbeatable_strength(combo) for combo in sequence]
         
         # Sort từ mạnh → yếu
         sorted_strengths = sorted(strengths, reverse=True)
@@ -70,7 +78,8 @@ class UnbeatableProbabilityCalculator:
         return (validation_conf + pattern_score) / 2.0
     
     @staticmethod
-    def calculate_sequence_stats(sequence: List[Dict[str, Any]], user_patterns: Dict[str, Any]) -> Dict[str, Any]:
+    def calculate_sequence_stats(sequence: List[Dict[str, Any]],
+                                 user_patterns: Dict[str, Any]) -> Dict[str, Any]:
         """
         Calculate comprehensive sequence statistics
         
@@ -90,16 +99,18 @@ class UnbeatableProbabilityCalculator:
             }
         
         # Use combo_strength for stats (represents actual power)
-        strengths = [ComboAnalyzer.calculate_combo_strength(combo) for combo in sequence]
+        # One array shared by every reduction below
+        arr = ComboArray.from_list(sequence)
+        strengths = arr.strength
         
         return {
-            'total_cards': sum(len(combo.get('cards', [])) for combo in sequence),
-            'avg_strength': float(np.mean(strengths)),
-            'unbeatable_combos': sum(1 for s in strengths if s >= 0.8),
+            'total_cards': arr.total_cards,
+            'avg_strength': fsum(strengths) / len(strengths),
+            'unbeatable_combos': int(np.count_nonzero(strengths >= 0.8)),
             'pattern_used': user_patterns.get('sequence_building_preference', 'unknown'),
-            'max_strength': float(np.max(strengths)),
-            'min_strength': float(np.min(strengths)),
-            'strength_variance': float(np.var(strengths))
+            'max_strength': float(strengths.max()),
+            'min_strength': float(strengths.min()),
+            'strength_variance': float(strengths.var())
         }
     
     @staticmethod
@@ -124,28 +135,29 @@ class UnbeatableProbabilityCalculator:
                 'strength_distribution': {}
             }
         
-        strengths = [ComboAnalyzer.calculate_combo_strength(combo) for combo in combos]
+        arr = ComboArray.from_list(combos)
+        
+        # Bucket every strength in one pass: bucket i = number of edges <= s
+        buckets = np.bincount(
+            np.searchsorted(_DISTRIBUTION_EDGES, arr.strength, side='right'),
+            minlength=len(_DISTRIBUTION_EDGES) + 1
+        ).tolist()
+        very_weak, weak, medium, strong, unbeatable = buckets
         
-        strong_combos = sum(1 for s in strengths if s >= 0.7)
-        unbeatable_combos = sum(1 for s in strengths if s >= 0.8)
-        weak_combos = sum(1 for s in strengths if s < 0.5)
+        strong_combos = strong + unbeatable
+        unbeatable_combos = unbeatable
+        weak_combos = very_weak + weak
         
         # Strength distribution by ranges
-        strength_distribution = {
-            'very_weak': sum(1 for s in strengths if s < 0.3),
-            'weak': sum(1 for s in strengths if 0.3 <= s < 0.5),
-            'medium': sum(1 for s in strengths if 0.5 <= s < 0.7),
-            'strong': sum(1 for s in strengths if 0.7 <= s < 0.8),
-            'unbeatable': sum(1 for s in strengths if s >= 0.8)
-        }
+        strength_distribution = dict(zip(_DISTRIBUTION_KEYS, buckets))
         
         return {
-            'total_combos': len(combos),
-            'total_cards': sum(len(combo.get('cards', [])) for combo in combos),
-            'avg_strength': float(np.mean(strengths)),
+            'total_combos': len(arr),
+            'total_cards': arr.total_cards,
+            'avg_strength': fsum(arr.strength) / len(arr),
             'strong_combos': strong_combos,
             'unbeatable_combos': unbeatable_combos,
             'weak_combos': weak_combos,
             'strength_distribution': strength_distribution,
-            'strengths': strengths
+            'strengths': arr.strength.tolist()
         }
@@ -0,0 +1,31 @@
+"""
+Integer cache keys for SequenceOrderProvider
+A hand of distinct card ids (0-51) packs into one 52-bit mask
+"""
+
+from typing import List
+
+# Ordering strategies understood by SequenceOrderProvider.get_ordered_sequence
+STRATEGY_IDS = {
+    'strength_desc': 0,
+    'strength_asc': 1,
+    'pattern_based': 2,
+    'balanced': 3,
+}
+
+
+def hand_mask(hand: List[int]) -> int:
+    """Bitmask with bit c set for every card id c in hand"""
+    mask = 0
+    for card in hand:
+        mask |= 1 << card
+    return mask
+
+
+def hand_key(hand: List[int], player_count: int, strategy: str) -> int:
+    """Pack (hand mask, player_count, strategy) into one int
+    
+    Layout: hand mask << 12 | player_count (8 bits) << 4 | strategy id (4 bits).
+    strategy must be a key of STRATEGY_IDS.
+    """
+    return (hand_mask(hand) << 12) | ((player_count & 0xFF) << 4) | STRATEGY_IDS[strategy]
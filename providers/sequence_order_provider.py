@@ -4,22 +4,55 @@ Ensures Báo Sâm decision and actual gameplay use the same sequence order
 """
 
 import logging
-from typing import List, Dict, Any, Optional
+from collections import OrderedDict
+from itertools import zip_longest
+from math import fsum
+from typing import List, Dict, Any, Optional, NamedTuple
 
 from ai_common.core.combo_analyzer import ComboAnalyzer
 from ai_common.rules.sam_rule_engine import SamRuleEngine
 from ai_common.features.sequence_features import SequenceFeatureExtractor
+from ai_common.providers._bitkey import STRATEGY_IDS, hand_key, hand_mask
 
 logger = logging.getLogger(__name__)
 
 
+class _AnalyzedHand(NamedTuple):
+    """analyze_hand output with each combo scored once and sorted strongest-first"""
+    combos: List[Dict[str, Any]]
+    strengths: List[float]
+    desc_order: List[int]
+    desc_combos: List[Dict[str, Any]]
+
+
+def _copy_combo(combo: Dict[str, Any]) -> Dict[str, Any]:
+    """Copy of a combo dict with its list values (cards) copied too"""
+    return {k: list(v) if isinstance(v, list) else v for k, v in combo.items()}
+
+
 class SequenceOrderProvider:
-    """Provider for consistent sequence ordering across decision and gameplay"""
+    """Provider for consistent sequence ordering across decision and gameplay
+    
+    Ordered sequences are memoized in a bounded LRU keyed by an int packing
+    the hand bitmask, player count and ordering strategy, so repeated
+    lookups for the same hand skip analyze_hand and the ordering pass.
+    analyze_hand results are cached per hand as well, together with their
+    strengths and strongest-first order, so every ordering of a hand is a
+    permutation of the same combo dicts and no strategy re-scores or re-sorts.
+    """
+    
+    _SEQUENCE_CACHE_SIZE = 1024
+    # One analysis serves every ordering strategy and player count of a hand
+    _ANALYSIS_CACHE_SIZE = 256
     
     def __init__(self):
         self.combo_analyzer = ComboAnalyzer()
         self.rule_engine = SamRuleEngine()
         self.feature_extractor = SequenceFeatureExtractor()
+        # Bound once; strength scoring runs per combo in every ordering
+        self._strength_fn = ComboAnalyzer.calculate_combo_strength
+        self._sequence_cache: "OrderedDict[int, List[Dict[str, Any]]]" = OrderedDict()
+        self._analysis_cache: "OrderedDict[int, _AnalyzedHand]" = OrderedDict()
         logger.info("SequenceOrderProvider initialized")
     
     def get_ordered_sequence(self, hand: List[int], player_count: int = 4, 
@@ -39,86 +72,126 @@ class SequenceOrderProvider:
         Returns:
             List of combos in optimal order
         """
-        # Analyze hand to get all possible combos
-        combos = self.combo_analyzer.analyze_hand(hand)
+        # Callers get their own list and combo dicts so the cache can't be edited through them
+        return [_copy_combo(combo) for combo in self._cached_ordered_sequence(hand, player_count, order_strategy)]
+    
+    def _cached_ordered_sequence(self, hand: List[int], player_count: int,
+                                 order_strategy: str) -> List[Dict[str, Any]]:
+        """Ordered sequence shared with the sequence cache; callers must not modify it"""
+        if order_strategy not in STRATEGY_IDS:
+            logger.warning(f"Unknown order strategy: {order_strategy}, using strength_desc")
+            order_strategy = "strength_desc"
         
-        if not combos:
+        key = hand_key(hand, player_count, order_strategy)
+        cache = self._sequence_cache
+        sequence = cache.get(key)
+        if sequence is None:
+            sequence = cache[key] = self._build_ordered_sequence(hand, player_count, order_strategy)
+            if len(cache) > self._SEQUENCE_CACHE_SIZE:
+                cache.popitem(last=False)
+        else:
+            cache.move_to_end(key)
+        return sequence
+    
+    def _build_ordered_sequence(self, hand: List[int], player_count: int,
+                                order_strategy: str) -> List[Dict[str, Any]]:
+        """get_ordered_sequence body behind the sequence cache"""
+        # Analyze hand to get all possible combos, scored and sorted once
+        analyzed = self._analyze_sorted(hand)
+        
+        if not analyzed.combos:
             logger.warning("No combos found for hand")
             return []
         
         # Apply ordering strategy
         if order_strategy == "strength_desc":
-            return self._order_by_strength_desc(combos)
+            return self._order_by_strength_desc(analyzed)
         elif order_strategy == "strength_asc":
-            return self._order_by_strength_asc(combos)
+            return self._order_by_strength_asc(analyzed)
         elif order_strategy == "pattern_based":
-            return self._order_by_pattern(combos, hand, player_count)
-        elif order_strategy == "balanced":
-            return self._order_balanced(combos)
+            return self._order_by_pattern(analyzed, hand, player_count)
         else:
-            logger.warning(f"Unknown order strategy: {order_strategy}, using strength_desc")
-            return self._order_by_strength_desc(combos)
+            return self._order_balanced(analyzed)
     
-    def _order_by_strength_desc(self, combos: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    def _analyze_sorted(self, hand: List[int]) -> _AnalyzedHand:
+        """analyze_hand plus strengths and strongest-first order, memoized per hand"""
+        key = hand_mask(hand)
+        cache = self._analysis_cache
+        analyzed = cache.get(key)
+        if analyzed is not None:
+            cache.move_to_end(key)
+            return analyzed
+        
+        combos = self.combo_analyzer.analyze_hand(hand)
+        strength = self._strength_fn
+        strengths = [strength(combo) for combo in combos]
+        # sorted is stable (reverse=True included), so equal strengths keep their analyze_hand order
+        desc_order = sorted(range(len(combos)), key=strengths.__getitem__, reverse=True)
+        analyzed = cache[key] = _AnalyzedHand(
+            combos=combos,
+            strengths=strengths,
+            desc_order=desc_order,
+            desc_combos=[combos[i] for i in desc_order],
+        )
+        if len(cache) > self._ANALYSIS_CACHE_SIZE:
+            cache.popitem(last=False)
+        return analyzed
+    
+    def _order_by_strength_desc(self, analyzed: _AnalyzedHand) -> List[Dict[str, Any]]:
         """Order by strength descending (strongest first)"""
-        return sorted(combos, key=lambda combo: -self.combo_analyzer.calculate_combo_strength(combo))
+        return analyzed.desc_combos
     
-    def _order_by_strength_asc(self, combos: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    def _order_by_strength_asc(self, analyzed: _AnalyzedHand) -> List[Dict[str, Any]]:
         """Order by strength ascending (weakest first)"""
-        return sorted(combos, key=lambda combo: self.combo_analyzer.calculate_combo_strength(combo))
+        # Not desc_combos[::-1]: ties must keep analyze_hand order here too
+        combos = analyzed.combos
+        return [combos[i] for i in sorted(range(len(combos)), key=analyzed.strengths.__getitem__)]
     
-    def _order_by_pattern(self, combos: List[Dict[str, Any]], hand: List[int], player_count: int) -> List[Dict[str, Any]]:
+    def _order_by_pattern(self, analyzed: _AnalyzedHand, hand: List[int], player_count: int) -> List[Dict[str, Any]]:
         """Order based on user patterns (similar to unbeatable model)"""
         hand_data = {
             'hand': hand,
             'player_count': player_count,
-            'possible_combos': combos
+            'possible_combos': analyzed.combos
         }
         
-        # Extract pattern features
-        pattern_features = self.feature_extractor.extract_pattern_features(hand_data)
+        # Extract pattern features, seeding the extractor's cache with the known strengths
+        strength_cache = dict(zip(map(id, analyzed.combos), analyzed.strengths))
+        pattern_features = self.feature_extractor.extract_pattern_features(hand_data, strength_cache)
         
         # Determine pattern preference
         power_concentration = pattern_features[1]  # From extract_pattern_features
         if power_concentration > 0.6:
             # Power-first: strongest combos first
-            return self._order_by_strength_desc(combos)
+            return self._order_by_strength_desc(analyzed)
         else:
             # Balanced: mix strong and weak
-            return self._order_balanced(combos)
+            return self._order_balanced(analyzed)
     
-    def _order_balanced(self, combos: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    def _order_balanced(self, analyzed: _AnalyzedHand) -> List[Dict[str, Any]]:
         """Order with balanced distribution (strong-weak-strong pattern)"""
-        # Sort by strength first
-        sorted_combos = sorted(combos, key=lambda combo: -self.combo_analyzer.calculate_combo_strength(combo))
+        strengths = analyzed.strengths
         
-        # Create balanced order: strong, weak, medium, strong, weak, etc.
+        # Bucket the strongest-first order: strong, medium, weak
         strong_combos = []
         medium_combos = []
         weak_combos = []
-        
-        for combo in sorted_combos:
-            strength = self.combo_analyzer.calculate_combo_strength(combo)
+        for i in analyzed.desc_order:
+            strength = strengths[i]
             if strength >= 0.7:
-                strong_combos.append(combo)
+                strong_combos.append(i)
             elif strength >= 0.4:
-                medium_combos.append(combo)
+                medium_combos.append(i)
             else:
-                weak_combos.append(combo)
+                weak_combos.append(i)
         
         # Interleave: strong, weak, medium, strong, weak, etc.
-        balanced = []
-        max_len = max(len(strong_combos), len(weak_combos), len(medium_combos))
-        
-        for i in range(max_len):
-            if i < len(strong_combos):
-                balanced.append(strong_combos[i])
-            if i < len(weak_combos):
-                balanced.append(weak_combos[i])
-            if i < len(medium_combos):
-                balanced.append(medium_combos[i])
-        
-        return balanced
+        combos = analyzed.combos
+        return [
+            combos[i]
+            for row in zip_longest(strong_combos, weak_combos, medium_combos)
+            for i in row if i is not None
+        ]
     
     def get_sequence_with_strategy(self, hand: List[int], player_count: int = 4,
                                  strategy: str = "bao_sam_optimal") -> Dict[str, Any]:
@@ -186,8 +259,9 @@ class SequenceOrderProvider:
         if not sequence:
             return 0.0
         
-        strengths = [self.combo_analyzer.calculate_combo_strength(combo) for combo in sequence]
-        return sum(strengths) / len(strengths)
+        strength = self._strength_fn
+        strengths = [strength(combo) for combo in sequence]
+        return fsum(strengths) / len(strengths)
     
     def validate_sequence_consistency(self, hand: List[int], player_count: int = 4) -> Dict[str, Any]:
         """
@@ -200,30 +274,39 @@ class SequenceOrderProvider:
         Returns:
             Validation results
         """
-        # Get sequence from this provider
-        provider_sequence = self.get_ordered_sequence(hand, player_count, "pattern_based")
+        # Get sequence from this provider (the cached one; copies are returned below)
+        provider_sequence = self._cached_ordered_sequence(hand, player_count, "pattern_based")
         
         # Get sequence from unbeatable model (if available)
         try:
             # This would need to be integrated with the actual unbeatable model
             # For now, we'll simulate the comparison
-            unbeatable_sequence = self.get_ordered_sequence(hand, player_count, "strength_desc")
+            unbeatable_sequence = self._cached_ordered_sequence(hand, player_count, "strength_desc")
             
             # Compare sequences
-            provider_strengths = [self.combo_analyzer.calculate_combo_strength(c) for c in provider_sequence]
-            unbeatable_strengths = [self.combo_analyzer.calculate_combo_strength(c) for c in unbeatable_sequence]
+            # Both sequences order the same cached combo dicts, whose strengths are already known
+            analyzed = self._analyze_sorted(hand)
+            strength_by_id = dict(zip(map(id, analyzed.combos), analyzed.strengths))
+            strength = self._strength_fn
+            
+            def strength_of(combo):
+                s = strength_by_id.get(id(combo))
+                return strength(combo) if s is None else s
+            
+            provider_strengths = [strength_of(c) for c in provider_sequence]
+            unbeatable_strengths = [strength_of(c) for c in unbeatable_sequence]
             
             return {
                 'consistent': provider_strengths == unbeatable_strengths,
-                'provider_sequence': provider_sequence,
-                'unbeatable_sequence': unbeatable_sequence,
-                'provider_avg_strength': sum(provider_strengths) / len(provider_strengths) if provider_strengths else 0,
-                'unbeatable_avg_strength': sum(unbeatable_strengths) / len(unbeatable_strengths) if unbeatable_strengths else 0
+                'provider_sequence': [_copy_combo(combo) for combo in provider_sequence],
+                'unbeatable_sequence': [_copy_combo(combo) for combo in unbeatable_sequence],
+                'provider_avg_strength': fsum(provider_strengths) / len(provider_strengths) if provider_strengths else 0,
+                'unbeatable_avg_strength': fsum(unbeatable_strengths) / len(unbeatable_strengths) if unbeatable_strengths else 0
             }
         except Exception as e:
             logger.warning(f"Could not validate consistency: {e}")
             return {
                 'consistent': False,
                 'error': str(e),
-                'provider_sequence': provider_sequence
+                'provider_sequence': [_copy_combo(combo) for combo in provider_sequence]
             }
@@ -5,6 +5,7 @@ Extracted from model_build/scripts/unbeatable/unbeatable_sequence_model.py
 
 import numpy as np
 import logging
+from math import fsum
 from typing import List, Dict, Any, Tuple
 
 from ai_common.core.combo_analyzer import ComboAnalyzer
@@ -38,30 +39,39 @@ class SamRuleEngine:
         if not possible_combos:
             return False, "no_combos_found", {}
         
-        # Calculate total cards
-        total_cards = sum(len(combo.get('cards', [])) for combo in possible_combos)
-        
-        # Calculate strengths
-        strengths = [ComboAnalyzer.calculate_combo_strength(combo) for combo in possible_combos]
+        # Read on every call so later edits to self.rules take effect
+        rules = self.rules
         
-        # Rule checks
-        if total_cards < self.rules['min_total_cards']:
+        # Card count is the cheapest rule, so check it before scoring anything
+        total_cards = sum(len(combo.get('cards', [])) for combo in possible_combos)
+        if total_cards < rules['min_total_cards']:
             return False, f"insufficient_cards_{total_cards}", {}
         
-        weak_combos = sum(1 for s in strengths if s < 0.5)
-        if weak_combos > self.rules['max_weak_combos']:
+        # Score and count combos in one pass
+        weak_combos = strong_combos = unbeatable_combos = 0
+        strengths = np.empty(len(possible_combos), dtype=np.float64)
+        combo_strength = ComboAnalyzer.calculate_combo_strength
+        for i, combo in enumerate(possible_combos):
+            strength = combo_strength(combo)
+            strengths[i] = strength
+            if strength < 0.5:
+                weak_combos += 1
+            elif strength >= 0.7:
+                strong_combos += 1
+                if strength >= 0.8:
+                    unbeatable_combos += 1
+        
+        if weak_combos > rules['max_weak_combos']:
             return False, f"too_many_weak_combos_{weak_combos}", {}
         
-        strong_combos = sum(1 for s in strengths if s >= 0.7)
-        if strong_combos < self.rules['min_strong_combos']:
+        if strong_combos < rules['min_strong_combos']:
             return False, f"insufficient_strong_combos_{strong_combos}", {}
         
-        avg_strength = np.mean(strengths)
-        if avg_strength < self.rules['min_avg_strength']:
+        avg_strength = fsum(strengths) / len(strengths)
+        if avg_strength < rules['min_avg_strength']:
             return False, f"low_avg_strength_{avg_strength:.2f}", {}
         
-        unbeatable_combos = sum(1 for s in strengths if s >= 0.8)
-        if unbeatable_combos < self.rules['min_unbeatable_combos']:
+        if unbeatable_combos < rules['min_unbeatable_combos']:
             return False, f"no_unbeatable_combos_{unbeatable_combos}", {}
         
         strength_profile = {
@@ -69,7 +79,7 @@ class SamRuleEngine:
             'avg_strength': avg_strength,
             'strong_combos': strong_combos,
             'unbeatable_combos': unbeatable_combos,
-            'strengths': strengths
+            'strengths': strengths.tolist()
         }
         
         logger.debug(f"Hand validation passed: {strength_profile}")
@@ -0,0 +1,125 @@
+"""
+Move Scoring
+
+Move-scoring helpers shared by the game strategies. Legal moves arrive
+as dicts; MoveBatch decodes the fields scoring needs once per batch.
+"""
+
+from dataclasses import dataclass
+from enum import IntEnum
+from typing import List, Dict, Any, Optional, Tuple
+
+
+# Rank of every card id 0-51 (card % 13, suits in blocks of 13); rank 12 is the 2
+CARD_RANK = bytes(range(13)) * 4
+
+
+class MoveType(IntEnum):
+    """Integer tags for move['type']"""
+    PASS = 0
+    PLAY = 1
+
+
+class ComboCode(IntEnum):
+    """Integer tags for move['combo_type']"""
+    UNKNOWN = 0
+    SINGLE = 1
+    PAIR = 2
+    TRIPLE = 3
+    STRAIGHT = 4
+    DOUBLE_SEQ = 5
+    FOUR_KIND = 6
+
+
+# Decode tables; moves may carry either the legacy string tags or the enums
+_MOVE_TYPES = {
+    'pass': MoveType.PASS,
+    'play_cards': MoveType.PLAY,
+    **{move_type: move_type for move_type in MoveType},
+}
+_COMBO_CODES = {
+    'single': ComboCode.SINGLE,
+    'pair': ComboCode.PAIR,
+    'triple': ComboCode.TRIPLE,
+    'straight': ComboCode.STRAIGHT,
+    'double_seq': ComboCode.DOUBLE_SEQ,
+    'four_kind': ComboCode.FOUR_KIND,
+    **{code: code for code in ComboCode},
+}
+
+# Base-score bonus per ComboCode: straights and double sequences get +0.2
+COMBO_BONUS = (0.0, 0.0, 0.0, 0.0, 0.2, 0.2, 0.0)
+
+
+def argmax(scores: List[float]) -> int:
+    """Index of the highest score in one pass; the first one wins ties"""
+    best_index = 0
+    best_score = scores[0]
+    for index in range(1, len(scores)):
+        score = scores[index]
+        if score > best_score:
+            best_index, best_score = index, score
+    return best_index
+
+
+def move_type_of(move: Dict[str, Any]) -> Optional[MoveType]:
+    """MoveType of a move dict, or None for an unrecognised type"""
+    return _MOVE_TYPES.get(move.get('type'))
+
+
+def combo_code_of(move: Dict[str, Any]) -> ComboCode:
+    """ComboCode of a move dict (UNKNOWN when missing or unrecognised)"""
+    return _COMBO_CODES.get(move.get('combo_type', 'unknown'), ComboCode.UNKNOWN)
+
+
+def base_move_score(move: Dict[str, Any]) -> float:
+    """Game-independent base score of one move dict (see MoveBatch.base_scores)"""
+    move_type = move_type_of(move)
+    if move_type is MoveType.PASS:
+        return 0.1  # Low score for passing
+    
+    if move_type is MoveType.PLAY and move.get('cards'):
+        # Higher rank = higher score, plus bonus for certain combo types
+        return move.get('rank_value', 0) / 12.0 + COMBO_BONUS[combo_code_of(move)]
+    
+    return 0.0
+
+
+@dataclass(frozen=True)
+class MoveBatch:
+    """Parallel per-move fields for a list of move dicts"""
+    moves: List[Dict[str, Any]]
+    types: Tuple[Optional[MoveType], ...]
+    has_cards: Tuple[bool, ...]
+    rank_values: Tuple[Any, ...]
+    combo_codes: Tuple[ComboCode, ...]
+
+    @classmethod
+    def from_moves(cls, moves: List[Dict[str, Any]]) -> 'MoveBatch':
+        """Decode every move dict once"""
+        return cls(
+            moves,
+            tuple(move_type_of(move) for move in moves),
+            tuple(bool(move.get('cards')) for move in moves),
+            tuple(move.get('rank_value', 0) for move in moves),
+            tuple(combo_code_of(move) for move in moves),
+        )
+
+    def __len__(self) -> int:
+        return len(self.moves)
+
+    def base_scores(self) -> List[float]:
+        """Base score per move: 0.1 for a pass, rank_value / 12 plus the
+        combo bonus for a play with cards, 0.0 otherwise"""
+        scores = []
+        append = scores.append
+        for move_type, has_cards, rank_value, combo_code in zip(
+            self.types, self.has_cards, self.rank_values, self.combo_codes
+        ):
+            if move_type is MoveType.PASS:
+                append(0.1)
+            elif move_type is MoveType.PLAY and has_cards:
+                append(rank_value / 12.0 + COMBO_BONUS[combo_code])
+            else:
+                append(0.0)
+        return scores
@@ -8,11 +8,20 @@ functionality and ensuring consistent behavior.
 from abc import ABC, abstractmethod
 from typing import List, Dict, Any, Optional
 from dataclasses import dataclass
+from concurrent.futures import Executor
+from itertools import repeat
 import logging
+import os
 
 logger = logging.getLogger(__name__)
 
 
+def _evaluate_move_task(strategy: 'BaseStrategy', game_state: Dict[str, Any],
+                        move: Dict[str, Any]) -> float:
+    """Pool task: evaluate_move on the worker's copy of the strategy"""
+    return strategy.evaluate_move(move, game_state)
+
+
 @dataclass
 class StrategyConfig:
     """Strategy configuration"""
@@ -21,6 +30,23 @@ class StrategyConfig:
     aggressiveness: float = 0.5  # 0.0 = conservative, 1.0 = aggressive
     risk_tolerance: float = 0.5  # 0.0 = risk-averse, 1.0 = risk-taking
     metadata: Dict[str, Any] = None
+    parallel_min_moves: int = 16  # Smallest move list worth sending to the scoring executor
+
+
+class _PerformanceStats:
+    """Decision counters and timings, exposed as a dict via as_dict()"""
+    __slots__ = ('total_decisions', 'successful_decisions', 'failed_decisions',
+                 'average_decision_time', 'last_decision_time')
+    
+    def __init__(self):
+        self.total_decisions = 0
+        self.successful_decisions = 0
+        self.failed_decisions = 0
+        self.average_decision_time = 0.0
+        self.last_decision_time = 0.0
+    
+    def as_dict(self) -> Dict[str, Any]:
+        return {name: getattr(self, name) for name in self.__slots__}
 
 
 class BaseStrategy(ABC):
@@ -34,22 +60,19 @@ class BaseStrategy(ABC):
     - Performance tracking
     """
     
-    def __init__(self, config: StrategyConfig):
+    def __init__(self, config: StrategyConfig, executor: Optional[Executor] = None):
         """
         Initialize strategy
         
         Args:
             config: Strategy configuration
+            executor: Caller-owned executor for scoring large move lists in
+                parallel (optional; the caller shuts it down)
         """
         self.config = config
+        self.executor = executor
         self.logger = logging.getLogger(f"{__name__}.{config.name}")
-        self._performance_stats = {
-            'total_decisions': 0,
-            'successful_decisions': 0,
-            'failed_decisions': 0,
-            'average_decision_time': 0.0,
-            'last_decision_time': 0.0
-        }
+        self._performance_stats = _PerformanceStats()
     
     @abstractmethod
     def evaluate_move(self, move: Dict[str, Any], game_state: Dict[str, Any]) -> float:
@@ -105,18 +128,58 @@ class BaseStrategy(ABC):
             'game_type': self.config.game_type,
             'aggressiveness': self.config.aggressiveness,
             'risk_tolerance': self.config.risk_tolerance,
-            'performance_stats': self._performance_stats.copy()
+            'performance_stats': self._performance_stats.as_dict()
         }
     
+    def _score_moves(self, moves: List[Dict[str, Any]], game_state: Dict[str, Any]) -> List[float]:
+        """
+        Score moves in one call; subclasses may batch the work
+        
+        Args:
+            moves: Moves to score
+            game_state: Current game state
+            
+        Returns:
+            List of scores aligned with moves
+        """
+        if self._uses_scoring_pool(len(moves)):
+            return self._score_moves_in_pool(moves, game_state)
+        return [self.evaluate_move(move, game_state) for move in moves]
+    
+    def __getstate__(self) -> Dict[str, Any]:
+        """Pickle without the executor; copies sent to pool workers score serially"""
+        state = self.__dict__.copy()
+        state['executor'] = None
+        return state
+    
+    def _uses_scoring_pool(self, n_moves: int) -> bool:
+        """Whether n_moves moves should be scored on the executor"""
+        return self.executor is not None and n_moves >= self.config.parallel_min_moves
+    
+    def _score_moves_in_pool(self, moves: List[Dict[str, Any]], game_state: Dict[str, Any]) -> List[float]:
+        """
+        Score moves with evaluate_move on the caller's executor
+        
+        The strategy instance itself is sent, so any state set on it after
+        __init__ reaches the workers. A process pool pickles each chunk of
+        tasks in one go, which sends the strategy and game state once per
+        chunk. This only pays off once evaluate_move does real work per move.
+        
+        Args:
+            moves: Moves to score
+            game_state: Current game state
+            
+        Returns:
+            List of scores aligned with moves
+        """
+        chunk_size = -(-len(moves) // (os.cpu_count() or 1))
+        return list(self.executor.map(
+            _evaluate_move_task, repeat(self), repeat(game_state), moves, chunksize=chunk_size
+        ))
+    
     def reset_performance_stats(self) -> None:
         """Reset performance statistics"""
-        self._performance_stats = {
-            'total_decisions': 0,
-            'successful_decisions': 0,
-            'failed_decisions': 0,
-            'average_decision_time': 0.0,
-            'last_decision_time': 0.0
-        }
+        self._performance_stats = _PerformanceStats()
     
     def _update_performance_stats(self, success: bool, decision_time: float) -> None:
         """
@@ -127,14 +190,13 @@ class BaseStrategy(ABC):
             decision_time: Time taken for decision
         """
         stats = self._performance_stats
-        stats['total_decisions'] += 1
-        stats['last_decision_time'] = decision_time
+        stats.total_decisions += 1
+        stats.last_decision_time = decision_time
         
         if success:
-            stats['successful_decisions'] += 1
+            stats.successful_decisions += 1
         else:
-            stats['failed_decisions'] += 1
+            stats.failed_decisions += 1
         
-        # Update average decision time
-        total_time = stats['average_decision_time'] * (stats['total_decisions'] - 1)
-        stats['average_decision_time'] = (total_time + decision_time) / stats['total_decisions']
+        # Update average decision time (incremental mean, no running total)
+        stats.average_decision_time += (decision_time - stats.average_decision_time) / stats.total_decisions
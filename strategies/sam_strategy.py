@@ -7,15 +7,30 @@ and decision-making patterns.
 
 from __future__ import annotations
 
+from functools import lru_cache
 from typing import List, Dict, Any, Optional
+from concurrent.futures import Executor
 import time
 import logging
 
 from .base_strategy import BaseStrategy, StrategyConfig
+from ._scoring import MoveBatch, argmax, base_move_score
 
 logger = logging.getLogger(__name__)
 
 
+@lru_cache(maxsize=4096)
+def _hand_strength_from_mask(hand_mask: int) -> float:
+    """Hand strength of the distinct cards in a 52-bit hand mask (see _calculate_hand_strength)"""
+    total_value = 0
+    mask = hand_mask
+    while mask:
+        low_bit = mask & -mask
+        total_value += (low_bit.bit_length() - 1) % 13
+        mask ^= low_bit
+    return total_value / (bin(hand_mask).count("1") * 12)
+
+
 class SamStrategy(BaseStrategy):
     """
     Sam-specific AI strategy.
@@ -27,12 +42,20 @@ class SamStrategy(BaseStrategy):
     - Penalty avoidance
     """
     
-    def __init__(self, config: Optional[StrategyConfig] = None):
+    # Scoring terms that are still placeholders (always 0.0) are not called;
+    # set the flag to True when implementing the term
+    _HAS_BAO_SAM_BONUS = False
+    _HAS_CHAT_BONUS = False
+    _HAS_PENALTY_PENALTY = False
+    
+    def __init__(self, config: Optional[StrategyConfig] = None,
+                 executor: Optional[Executor] = None):
         """
         Initialize Sam strategy
         
         Args:
             config: Strategy configuration (optional)
+            executor: Caller-owned executor for parallel move scoring (optional)
         """
         if config is None:
             config = StrategyConfig(
@@ -42,7 +65,7 @@ class SamStrategy(BaseStrategy):
                 risk_tolerance=0.4   # Lower risk tolerance for Sam
             )
         
-        super().__init__(config)
+        super().__init__(config, executor)
         self._sam_features = {}
     
     def evaluate_move(self, move: Dict[str, Any], game_state: Dict[str, Any]) -> float:
@@ -78,16 +101,19 @@ class SamStrategy(BaseStrategy):
         if not legal_moves:
             return {'type': 'pass', 'cards': []}
         
-        # Evaluate all legal moves
-        scored_moves = []
-        for move in legal_moves:
-            score = self.evaluate_move(move, game_state)
-            scored_moves.append((move, score))
+        # A single legal move is forced; there is nothing to score
+        if len(legal_moves) == 1:
+            return legal_moves[0]
+        
+        # Evaluate all legal moves in one batch
+        scores = self._score_moves(legal_moves, game_state)
         
-        # Select move with highest score
-        best_move, best_score = max(scored_moves, key=lambda x: x[1])
+        # Select move with highest score (first one on ties)
+        best_index = argmax(scores)
+        best_move, best_score = legal_moves[best_index], scores[best_index]
         
-        self.logger.debug(f"Sam Strategy: Selected move {best_move} with score {best_score:.3f}")
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug("Sam Strategy: Selected move %s with score %.3f", best_move, best_score)
         
         return best_move
     
@@ -127,28 +153,28 @@ class SamStrategy(BaseStrategy):
         Returns:
             float: Base move score
         """
-        if move.get('type') == 'pass':
-            return 0.1  # Low score for passing
+        return base_move_score(move)
+    
+    def _score_moves(self, moves: List[Dict[str, Any]], game_state: Dict[str, Any]) -> List[float]:
+        """
+        Score moves in one batch; equivalent to evaluate_move on each move.
         
-        if move.get('type') == 'play_cards':
-            cards = move.get('cards', [])
-            if not cards:
-                return 0.0
-            
-            # Base scoring on combo strength
-            combo_type = move.get('combo_type', 'unknown')
-            rank_value = move.get('rank_value', 0)
-            
-            # Higher rank = higher score
-            base_score = rank_value / 12.0
-            
-            # Bonus for certain combo types
-            if combo_type in ['straight', 'double_seq']:
-                base_score += 0.2
+        Subclasses that change evaluate_move or _evaluate_base_move override
+        this as well.
+        
+        Args:
+            moves: Moves to score
+            game_state: Current game state
             
-            return base_score
+        Returns:
+            List of scores aligned with moves
+        """
+        if self._uses_scoring_pool(len(moves)):
+            return self._score_moves_in_pool(moves, game_state)
         
-        return 0.0
+        base_scores = MoveBatch.from_moves(moves).base_scores()
+        apply_scoring = self._apply_sam_scoring
+        return [apply_scoring(move, game_state, base) for move, base in zip(moves, base_scores)]
     
     def _apply_sam_scoring(self, move: Dict[str, Any], game_state: Dict[str, Any], 
                           base_score: float) -> float:
@@ -166,16 +192,16 @@ class SamStrategy(BaseStrategy):
         enhanced_score = base_score
         
         # Consider Báo Sâm implications
-        bao_sam_bonus = self._calculate_bao_sam_bonus(move, game_state)
-        enhanced_score += bao_sam_bonus
+        if self._HAS_BAO_SAM_BONUS:
+            enhanced_score += self._calculate_bao_sam_bonus(move, game_state)
         
         # Consider chặt opportunities
-        chat_bonus = self._calculate_chat_bonus(move, game_state)
-        enhanced_score += chat_bonus
+        if self._HAS_CHAT_BONUS:
+            enhanced_score += self._calculate_chat_bonus(move, game_state)
         
         # Consider penalty avoidance
-        penalty_penalty = self._calculate_penalty_penalty(move, game_state)
-        enhanced_score -= penalty_penalty
+        if self._HAS_PENALTY_PENALTY:
+            enhanced_score -= self._calculate_penalty_penalty(move, game_state)
         
         return max(0.0, enhanced_score)  # Ensure non-negative score
     
@@ -192,6 +218,13 @@ class SamStrategy(BaseStrategy):
         if not hand:
             return 0.0
         
+        # Hands of distinct cards are memoized by their card mask
+        hand_mask = 0
+        for card in hand:
+            hand_mask |= 1 << card
+        if bin(hand_mask).count("1") == len(hand):
+            return _hand_strength_from_mask(hand_mask)
+        
         # Simple hand strength calculation
         # Higher cards = stronger hand
         total_value = sum(card % 13 for card in hand)
@@ -8,13 +8,47 @@ and decision-making patterns.
 from __future__ import annotations
 
 from typing import List, Dict, Any, Optional
+from concurrent.futures import Executor
 import time
 import logging
 
 from .base_strategy import BaseStrategy, StrategyConfig
+from ._scoring import MoveType, base_move_score, move_type_of
 
 logger = logging.getLogger(__name__)
 
+# Hands and moves as 52-bit masks: card c sets bit c (rank c % 13, suit c // 13)
+_TWO_MASK = (1 << 12) | (1 << 25) | (1 << 38) | (1 << 51)
+_FOUR_KIND_MASKS = frozenset(
+    sum(1 << (suit * 13 + rank) for suit in range(4)) for rank in range(13)
+)
+
+
+def _card_mask(cards: List[int]) -> int:
+    """Bitmask with bit c set for every card id c"""
+    mask = 0
+    for card in cards:
+        mask |= 1 << card
+    return mask
+
+
+def _ends_with_2_or_four_kind_mask(cards_mask: int, n_cards: int) -> bool:
+    """Cards contain a 2, or are exactly a four-of-a-kind"""
+    return bool(cards_mask & _TWO_MASK) or (n_cards == 4 and cards_mask in _FOUR_KIND_MASKS)
+
+
+def _violates_end_rules_mask(hand_mask: int, cards_mask: int, n_cards: int) -> bool:
+    """TLMN end-rule check on card masks (see TLMNStrategy._violates_tlmn_end_rules)"""
+    # Check if this would be the last move
+    remaining = hand_mask & ~cards_mask
+    
+    if not remaining:  # This is the last move
+        # Check if ending with 2 or four-of-a-kind
+        return _ends_with_2_or_four_kind_mask(cards_mask, n_cards)
+    
+    # Check if would leave only 2s, or exactly a four-of-a-kind
+    return not remaining & ~_TWO_MASK or remaining in _FOUR_KIND_MASKS
+
 
 class TLMNStrategy(BaseStrategy):
     """
@@ -27,12 +61,19 @@ class TLMNStrategy(BaseStrategy):
     - Kết 3 bích consideration
     """
     
-    def __init__(self, config: Optional[StrategyConfig] = None):
+    # Scoring terms that are still placeholders (always 0.0) are not called;
+    # set the flag to True when implementing the term
+    _HAS_COLOR_BONUS = False
+    _HAS_CHAT_BONUS = False
+    
+    def __init__(self, config: Optional[StrategyConfig] = None,
+                 executor: Optional[Executor] = None):
         """
         Initialize TLMN strategy
         
         Args:
             config: Strategy configuration (optional)
+            executor: Caller-owned executor for parallel move scoring (optional)
         """
         if config is None:
             config = StrategyConfig(
@@ -42,16 +83,34 @@ class TLMNStrategy(BaseStrategy):
                 risk_tolerance=0.7   # Higher risk tolerance for TLMN
             )
         
-        super().__init__(config)
+        super().__init__(config, executor)
         self._tlmn_features = {}
     
     def evaluate_move(self, move: Dict[str, Any], game_state: Dict[str, Any]) -> float:
         """
         Evaluate a move for TLMN with game-specific considerations.
         
+        select_best_move and _score_moves call _score_move directly, so
+        subclasses change scoring there or in the hooks it calls.
+        
+        Args:
+            move: Move to evaluate
+            game_state: Current game state
+            
+        Returns:
+            float: Move score (higher is better)
+        """
+        return self._score_move(move, game_state)
+    
+    def _score_move(self, move: Dict[str, Any], game_state: Dict[str, Any],
+                    violates: Optional[bool] = None) -> float:
+        """
+        Score one move; shared by evaluate_move, select_best_move and _score_moves.
+        
         Args:
             move: Move to evaluate
             game_state: Current game state
+            violates: Precomputed _violates_tlmn_end_rules result (optional)
             
         Returns:
             float: Move score (higher is better)
@@ -59,7 +118,7 @@ class TLMNStrategy(BaseStrategy):
         base_score = self._evaluate_base_move(move, game_state)
         
         # Apply TLMN-specific enhancements
-        tlmn_score = self._apply_tlmn_scoring(move, game_state, base_score)
+        tlmn_score = self._apply_tlmn_scoring(move, game_state, base_score, violates)
         
         return tlmn_score
     
@@ -68,6 +127,10 @@ class TLMNStrategy(BaseStrategy):
         """
         Select the best move for TLMN.
         
+        Filters and scores in a single pass, keeping the running best, so no
+        list of valid moves is built; each move's end-rule check is done once
+        and shared by the filter and the end-game penalty.
+        
         Args:
             legal_moves: Available legal moves
             game_state: Current game state
@@ -78,22 +141,24 @@ class TLMNStrategy(BaseStrategy):
         if not legal_moves:
             return {'type': 'pass', 'cards': []}
         
-        # Filter moves according to TLMN rules
-        valid_moves = self._filter_tlmn_moves(legal_moves, game_state)
+        hand_mask = _card_mask(game_state.get('hand', []))
+        best_move, best_score = None, 0.0
+        for move in legal_moves:
+            # Filter moves according to TLMN rules
+            violates = self._violates_tlmn_end_rules(move, game_state, hand_mask)
+            if not self._is_valid_tlmn_move(move, game_state, hand_mask, violates):
+                continue
+            
+            # Keep the highest score (first one on ties)
+            score = self._score_move(move, game_state, violates)
+            if best_move is None or score > best_score:
+                best_move, best_score = move, score
         
-        if not valid_moves:
+        if best_move is None:
             return {'type': 'pass', 'cards': []}
         
-        # Evaluate all valid moves
-        scored_moves = []
-        for move in valid_moves:
-            score = self.evaluate_move(move, game_state)
-            scored_moves.append((move, score))
-        
-        # Select move with highest score
-        best_move, best_score = max(scored_moves, key=lambda x: x[1])
-        
-        self.logger.debug(f"TLMN Strategy: Selected move {best_move} with score {best_score:.3f}")
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug("TLMN Strategy: Selected move %s with score %.3f", best_move, best_score)
         
         return best_move
     
@@ -122,31 +187,30 @@ class TLMNStrategy(BaseStrategy):
         Returns:
             float: Base move score
         """
-        if move.get('type') == 'pass':
-            return 0.1  # Low score for passing
+        return base_move_score(move)
+    
+    def _score_moves(self, moves: List[Dict[str, Any]], game_state: Dict[str, Any]) -> List[float]:
+        """
+        Score moves in one batch; equivalent to evaluate_move on each move.
         
-        if move.get('type') == 'play_cards':
-            cards = move.get('cards', [])
-            if not cards:
-                return 0.0
-            
-            # Base scoring on combo strength
-            combo_type = move.get('combo_type', 'unknown')
-            rank_value = move.get('rank_value', 0)
-            
-            # Higher rank = higher score
-            base_score = rank_value / 12.0
-            
-            # Bonus for certain combo types
-            if combo_type in ['straight', 'double_seq']:
-                base_score += 0.2
+        Args:
+            moves: Moves to score
+            game_state: Current game state
             
-            return base_score
-        
-        return 0.0
+        Returns:
+            List of scores aligned with moves
+        """
+        if self._uses_scoring_pool(len(moves)):
+            return self._score_moves_in_pool(moves, game_state)
+        
+        # One hand mask for every move's end-rule check
+        hand_mask = _card_mask(game_state.get('hand', []))
+        violates = self._violates_tlmn_end_rules
+        score_move = self._score_move
+        return [score_move(move, game_state, violates(move, game_state, hand_mask)) for move in moves]
     
     def _apply_tlmn_scoring(self, move: Dict[str, Any], game_state: Dict[str, Any], 
-                           base_score: float) -> float:
+                           base_score: float, violates: Optional[bool] = None) -> float:
         """
         Apply TLMN-specific scoring enhancements.
         
@@ -154,6 +218,7 @@ class TLMNStrategy(BaseStrategy):
             move: Move to evaluate
             game_state: Current game state
             base_score: Base move score
+            violates: Precomputed _violates_tlmn_end_rules result (optional)
             
         Returns:
             float: Enhanced score
@@ -161,20 +226,18 @@ class TLMNStrategy(BaseStrategy):
         enhanced_score = base_score
         
         # Consider color-based scoring
-        color_bonus = self._calculate_color_bonus(move, game_state)
-        enhanced_score += color_bonus
+        if self._HAS_COLOR_BONUS:
+            enhanced_score += self._calculate_color_bonus(move, game_state)
         
         # Consider chặt opportunities
-        chat_bonus = self._calculate_chat_bonus(move, game_state)
-        enhanced_score += chat_bonus
+        if self._HAS_CHAT_BONUS:
+            enhanced_score += self._calculate_chat_bonus(move, game_state)
         
         # Consider end-game rules
-        end_game_penalty = self._calculate_end_game_penalty(move, game_state)
-        enhanced_score -= end_game_penalty
+        enhanced_score -= self._calculate_end_game_penalty(move, game_state, violates)
         
         # Consider Kết 3 bích
-        ket_3_bich_bonus = self._calculate_ket_3_bich_bonus(move, game_state)
-        enhanced_score += ket_3_bich_bonus
+        enhanced_score += self._calculate_ket_3_bich_bonus(move, game_state)
         
         return max(0.0, enhanced_score)  # Ensure non-negative score
     
@@ -190,42 +253,50 @@ class TLMNStrategy(BaseStrategy):
         Returns:
             List of valid TLMN moves
         """
-        valid_moves = []
-        
-        for move in legal_moves:
-            if self._is_valid_tlmn_move(move, game_state):
-                valid_moves.append(move)
+        # The hand mask is shared by every move's end-rule check
+        hand_mask = _card_mask(game_state.get('hand', []))
         
-        return valid_moves
+        return [
+            move for move in legal_moves
+            if self._is_valid_tlmn_move(move, game_state, hand_mask)
+        ]
     
-    def _is_valid_tlmn_move(self, move: Dict[str, Any], game_state: Dict[str, Any]) -> bool:
+    def _is_valid_tlmn_move(self, move: Dict[str, Any], game_state: Dict[str, Any],
+                            hand_mask: Optional[int] = None,
+                            violates: Optional[bool] = None) -> bool:
         """
         Check if move is valid according to TLMN rules.
         
         Args:
             move: Move to check
             game_state: Current game state
+            hand_mask: Precomputed bitmask of game_state['hand'] (optional)
+            violates: Precomputed _violates_tlmn_end_rules result (optional)
             
         Returns:
             bool: True if valid
         """
-        if move.get('type') != 'play_cards':
+        if move_type_of(move) is not MoveType.PLAY:
             return True
         
         # Check TLMN end rules
-        if self._violates_tlmn_end_rules(move, game_state):
+        if violates is None:
+            violates = self._violates_tlmn_end_rules(move, game_state, hand_mask)
+        if violates:
             return False
         
         return True
     
     def _violates_tlmn_end_rules(self, move: Dict[str, Any], 
-                                game_state: Dict[str, Any]) -> bool:
+                                game_state: Dict[str, Any],
+                                hand_mask: Optional[int] = None) -> bool:
         """
         Check if move violates TLMN end rules.
         
         Args:
             move: Move to check
             game_state: Current game state
+            hand_mask: Precomputed bitmask of game_state['hand'] (optional)
             
         Returns:
             bool: True if violates rules
@@ -234,52 +305,24 @@ class TLMNStrategy(BaseStrategy):
         if not cards:
             return False
         
-        # Check if this would be the last move
-        hand = game_state.get('hand', [])
-        remaining_cards = [card for card in hand if card not in cards]
-        
-        if not remaining_cards:  # This is the last move
-            # Check if ending with 2 or four-of-a-kind
-            if self._ends_with_2_or_four_kind(cards):
-                return True
-        
-        # Check if would leave only 2s
-        if remaining_cards and all(self._is_2_card(card) for card in remaining_cards):
-            return True
-        
-        # Check if would leave exactly a four-of-a-kind
-        if len(remaining_cards) == 4:
-            if self._is_four_of_a_kind(remaining_cards):
-                return True
-        
-        return False
+        if hand_mask is None:
+            hand_mask = _card_mask(game_state.get('hand', []))
+        return _violates_end_rules_mask(hand_mask, _card_mask(cards), len(cards))
     
     def _ends_with_2_or_four_kind(self, cards: List[int]) -> bool:
         """Check if cards end with 2 or four-of-a-kind."""
         if not cards:
             return False
         
-        # Check if contains 2
-        if any(self._is_2_card(card) for card in cards):
-            return True
-        
-        # Check if is four-of-a-kind
-        if len(cards) == 4 and self._is_four_of_a_kind(cards):
-            return True
-        
-        return False
+        return _ends_with_2_or_four_kind_mask(_card_mask(cards), len(cards))
     
     def _is_2_card(self, card: int) -> bool:
         """Check if card is a 2."""
-        return card in [12, 25, 38, 51]
+        return bool(_TWO_MASK >> card & 1)
     
     def _is_four_of_a_kind(self, cards: List[int]) -> bool:
         """Check if cards form a four-of-a-kind."""
-        if len(cards) != 4:
-            return False
-        
-        ranks = [card % 13 for card in cards]
-        return len(set(ranks)) == 1
+        return len(cards) == 4 and _card_mask(cards) in _FOUR_KIND_MASKS
     
     def _calculate_color_bonus(self, move: Dict[str, Any], game_state: Dict[str, Any]) -> float:
         """Calculate color-based scoring bonus."""
@@ -291,9 +334,12 @@ class TLMNStrategy(BaseStrategy):
         # Placeholder - implement chặt logic
         return 0.0
     
-    def _calculate_end_game_penalty(self, move: Dict[str, Any], game_state: Dict[str, Any]) -> float:
-        """Calculate end-game rule penalty."""
-        if self._violates_tlmn_end_rules(move, game_state):
+    def _calculate_end_game_penalty(self, move: Dict[str, Any], game_state: Dict[str, Any],
+                                    violates: Optional[bool] = None) -> float:
+        """Calculate end-game rule penalty (violates: precomputed end-rule check, optional)."""
+        if violates is None:
+            violates = self._violates_tlmn_end_rules(move, game_state)
+        if violates:
             return 1.0  # High penalty for violating end rules
         return 0.0
     
@@ -0,0 +1,9 @@
+"""Pytest setup shared by the test modules: make the ai_common package importable."""
+
+import sys
+from pathlib import Path
+
+# Directory that contains the ai_common package, resolved once per session
+PROJECT_ROOT = str(Path(__file__).resolve().parents[2])
+if PROJECT_ROOT not in sys.path:
+    sys.path.insert(0, PROJECT_ROOT)
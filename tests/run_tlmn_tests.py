@@ -7,6 +7,7 @@ Script to run comprehensive tests for TLMN AI implementation.
 
 import sys
 import os
+import importlib.util
 import unittest
 from typing import List, Dict, Any
 
@@ -14,9 +15,69 @@ from typing import List, Dict, Any
 project_root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 sys.path.insert(0, project_root)
 
+TESTS_DIR = os.path.dirname(os.path.abspath(__file__))
+
+
+class _ResultCollector:
+    """Pytest plugin that tallies test outcomes for the summary"""
+    
+    def __init__(self):
+        self.total_tests = 0
+        self.failures: List[str] = []
+        self.errors: List[str] = []
+    
+    def pytest_collectreport(self, report):
+        if report.failed:
+            self.errors.append(str(report.longrepr))
+    
+    def pytest_runtest_logreport(self, report):
+        if report.when == 'call':
+            self.total_tests += 1
+            if report.failed:
+                self.failures.append(str(report.longrepr))
+        elif report.failed:
+            # Setup/teardown failures count as errors, like unittest
+            if report.when == 'setup':
+                self.total_tests += 1
+            self.errors.append(str(report.longrepr))
+
+
 def run_tlmn_tests() -> Dict[str, Any]:
     """
-    Run TLMN AI tests and return results.
+    Run TLMN AI tests with pytest and return results.
+    
+    Uses every core via pytest-xdist when it is installed.
+    
+    Returns:
+        Dict containing test results
+    """
+    # Imported here so --legacy runs without pytest installed
+    import pytest
+    
+    print("🧪 Running TLMN AI Tests...")
+    print("=" * 50)
+    
+    args = ['-q', os.path.join(TESTS_DIR, 'test_tlmn_ai.py')]
+    if importlib.util.find_spec('xdist') is not None:
+        args[1:1] = ['-n', 'auto']
+    
+    collector = _ResultCollector()
+    pytest.main(args, plugins=[collector])
+    
+    failed = len(collector.failures) + len(collector.errors)
+    return {
+        'total_tests': collector.total_tests,
+        'passed': max(collector.total_tests - failed, 0),
+        'failed': len(collector.failures),
+        'errors': collector.errors,
+        'success_rate': max(collector.total_tests - failed, 0) / collector.total_tests if collector.total_tests > 0 else 0,
+        'failures': collector.failures,
+    }
+
+
+def run_tlmn_tests_legacy() -> Dict[str, Any]:
+    """
+    Run TLMN AI tests with unittest and return results.
     
     Returns:
         Dict containing test results
@@ -81,8 +142,8 @@ def print_test_summary(results: Dict[str, Any]) -> None:
 def main():
     """Main function"""
     try:
-        # Run tests
-        results = run_tlmn_tests()
+        # Run tests (--legacy keeps the unittest runner)
+        results = run_tlmn_tests_legacy() if '--legacy' in sys.argv[1:] else run_tlmn_tests()
         
         # Print summary
         print_test_summary(results)
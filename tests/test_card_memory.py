@@ -0,0 +1,129 @@
+#!/usr/bin/env python3
+"""CardMemory bitboards agree with plain set-of-cards bookkeeping."""
+
+import random
+from types import SimpleNamespace
+
+import pytest
+
+pytest.importorskip("game_engine")
+
+from game_engine.core.card_encoding import Card, Rank, Suit
+
+from ai_common.memory.card_memory import CardMemory
+
+
+DECK = [Card.from_id(card_id) for card_id in range(52)]
+
+
+class SetMemory:
+    """Reference: played/remaining kept as sets of Card, every query a scan"""
+
+    def __init__(self):
+        self.played = set()
+        self.remaining = set(DECK)
+
+    def play(self, cards):
+        for card in cards:
+            self.played.add(card)
+            self.remaining.discard(card)
+
+    def probability(self, matches):
+        if not self.remaining:
+            return 0.0
+        return sum(1 for card in self.remaining if matches(card)) / len(self.remaining)
+
+
+def assert_same(memory, reference):
+    assert memory.get_played_cards() == reference.played
+    assert memory.get_remaining_cards() == reference.remaining
+    assert memory.played_cards == reference.played
+    assert memory.remaining_cards == reference.remaining
+    assert memory.get_played_count() == len(reference.played)
+    assert memory.get_remaining_count() == len(reference.remaining)
+
+    for rank in Rank:
+        assert memory.get_remaining_count_by_rank(rank) == sum(1 for c in reference.remaining if c.rank == rank)
+        assert memory.get_played_count_by_rank(rank) == sum(1 for c in reference.played if c.rank == rank)
+        assert memory.get_probability_of_rank(rank) == reference.probability(lambda c: c.rank == rank)
+    for suit in Suit:
+        assert memory.get_remaining_count_by_suit(suit) == sum(1 for c in reference.remaining if c.suit == suit)
+        assert memory.get_played_count_by_suit(suit) == sum(1 for c in reference.played if c.suit == suit)
+        assert memory.get_probability_of_suit(suit) == reference.probability(lambda c: c.suit == suit)
+    for card in DECK:
+        assert memory.is_card_played(card) == (card in reference.played)
+        assert memory.is_card_remaining(card) == (card in reference.remaining)
+
+    estimate = memory.get_opponent_hand_estimate(0, [])
+    remaining = reference.remaining
+    high = sum(1 for c in remaining if c.rank.value >= 8)
+    twos = sum(1 for c in remaining if c.rank == Rank.TWO)
+    assert estimate["high_cards_probability"] == (high / len(remaining) if remaining else 0)
+    assert estimate["dangerous_cards_probability"] == (twos / len(remaining) if remaining else 0)
+
+
+def test_bitboards_match_card_sets():
+    rng = random.Random(51)
+
+    for _ in range(200):
+        memory, reference = CardMemory(), SetMemory()
+        assert_same(memory, reference)
+        for turn in range(rng.randint(1, 20)):
+            # Cards may repeat across moves, as replayed or duplicated logs do
+            cards = rng.sample(DECK, rng.randint(0, 5))
+            memory.update_with_move(turn % 4, SimpleNamespace(cards=cards),
+                                    SimpleNamespace(turn_id=turn, round_id=1))
+            reference.play(cards)
+            assert_same(memory, reference)
+
+        memory.reset()
+        assert_same(memory, SetMemory())
+
+
+def test_critical_cards_follow_card_order():
+    rng = random.Random(10)
+
+    for _ in range(200):
+        memory = CardMemory()
+        played = rng.sample(DECK, rng.randint(0, 40))
+        memory.update_with_move(0, SimpleNamespace(cards=played), SimpleNamespace(turn_id=1, round_id=1))
+
+        # Reference: the original if/elif walk over the remaining cards, in deck order
+        expected = []
+        for card in DECK:
+            if card in played:
+                continue
+            if card.rank == Rank.TWO and card.suit == Suit.SPADES:
+                expected.append("2♠")
+            elif card.rank == Rank.TWO:
+                expected.append(f"2{card.suit.name[0]}")
+            elif card.rank.value >= 10:
+                expected.append(str(card))
+
+        assert memory.get_strategic_insights()["critical_cards_remaining"] == expected
+
+
+def test_card_views_are_read_only():
+    memory = CardMemory()
+
+    with pytest.raises(AttributeError):
+        memory.remaining_cards.discard(DECK[0])
+    with pytest.raises(AttributeError):
+        memory.played_cards.add(DECK[0])
+
+    # The get_* accessors still hand out mutable copies
+    remaining = memory.get_remaining_cards()
+    remaining.discard(DECK[0])
+    assert DECK[0] in memory.remaining_cards
+
+
+def test_unknown_cards_raise():
+    memory = CardMemory()
+
+    with pytest.raises(ValueError):
+        CardMemory.bitboard([DECK[0], "not-a-card"])
+    with pytest.raises(ValueError):
+        memory.update_with_move(0, SimpleNamespace(cards=[DECK[0], "not-a-card"]),
+                                SimpleNamespace(turn_id=1, round_id=1))
+    # A rejected move leaves the memory untouched
+    assert memory.get_played_count() == 0
@@ -0,0 +1,24 @@
+#!/usr/bin/env python3
+"""Unit tests for ComboAnalyzer combo strength."""
+
+import pytest
+
+from ai_common.core.combo_analyzer import ComboAnalyzer
+
+
+@pytest.mark.parametrize("combo_type", ["single", "pair", "triple", "four_kind", "double_seq"])
+def test_strength_ignores_cards_of_non_straights(combo_type):
+    with_cards = {"combo_type": combo_type, "rank_value": 9, "cards": [9, 22, 35, 48]}
+    without_cards = {"combo_type": combo_type, "rank_value": 9, "cards": None}
+
+    assert ComboAnalyzer.calculate_combo_strength(without_cards) == \
+        ComboAnalyzer.calculate_combo_strength(with_cards)
+
+
+def test_straight_strength_depends_on_length():
+    short = {"combo_type": "straight", "rank_value": 6, "cards": [2, 3, 4, 5, 6]}
+    long = {"combo_type": "straight", "rank_value": 6, "cards": [0, 1, 2, 3, 4, 5, 6]}
+
+    assert ComboAnalyzer.calculate_combo_strength(short) == pytest.approx(0.1 + 6 / 11 * 0.6 + 0.06)
+    assert ComboAnalyzer.calculate_combo_strength(long) == pytest.approx(0.1 + 6 / 11 * 0.6 + 0.1)
+    assert ComboAnalyzer.strength_of("straight", 6, 7) == ComboAnalyzer.calculate_combo_strength(long)
@@ -0,0 +1,64 @@
+#!/usr/bin/env python3
+"""JSONLLogger(dedupe=True) writes exactly the first copy of each repeated call."""
+
+import json
+import random
+
+from ai_common.data_logger import JSONLLogger
+
+
+def random_call(rng):
+    """(game_record, action_record, extra) drawn from a small pool so calls repeat"""
+    game_record = {
+        "game_id": rng.randrange(2),
+        "round_id": rng.randrange(2),
+        "turn_id": rng.randrange(3),
+        "player_id": rng.randrange(2),
+        "hand": [1, 2, 3],
+    }
+    cards = rng.choice([[], [4], [4, 17]])
+    action_record = {
+        "type": "pass" if not cards else "play_cards",
+        "cards": cards,
+        "combo_type": {0: None, 1: "single", 2: "pair"}[len(cards)],
+        "rank_value": cards[0] % 13 if cards else None,
+    }
+    extra = rng.choice([None, {"bot": "a"}, {"bot": "b"}])
+    return game_record, action_record, extra
+
+
+def read_lines(path):
+    with open(path, encoding="utf-8") as f:
+        return [json.loads(line) for line in f]
+
+
+def test_dedupe_drops_only_exact_repeats(tmp_path):
+    rng = random.Random(23)
+    calls = [random_call(rng) for _ in range(500)]
+
+    # Reference: plain logger fed each distinct call once, in first-seen order
+    seen, unique_calls = [], []
+    for call in calls:
+        if call not in seen:
+            seen.append(call)
+            unique_calls.append(call)
+    plain = JSONLLogger(str(tmp_path / "plain.jsonl"), include_timestamp=False)
+    for game_record, action_record, extra in unique_calls:
+        plain.write_action(dict(game_record), dict(action_record), extra)
+
+    deduped = JSONLLogger(str(tmp_path / "deduped.jsonl"), include_timestamp=False, dedupe=True)
+    for game_record, action_record, extra in calls:
+        deduped.write_action(dict(game_record), dict(action_record), extra)
+
+    assert len(unique_calls) < len(calls)
+    assert read_lines(deduped.file_path) == read_lines(plain.file_path)
+
+
+def test_dedupe_off_writes_every_call(tmp_path):
+    logger = JSONLLogger(str(tmp_path / "log.jsonl"), include_timestamp=False)
+    call = ({"game_id": 1, "round_id": 1, "turn_id": 1, "player_id": 0}, {"type": "pass"}, None)
+
+    logger.write_action(*call)
+    logger.write_action(*call)
+
+    assert len(read_lines(logger.file_path)) == 2
@@ -0,0 +1,60 @@
+#!/usr/bin/env python3
+"""MoveEvaluator.get_best_move matches a plain full-scoring argmax."""
+
+import random
+from types import SimpleNamespace
+
+import pytest
+
+pytest.importorskip("game_engine")
+
+from game_engine.core.card_encoding import Card
+from game_engine.core.combo_validator import ComboType
+
+from ai_common.evaluators.move_evaluator import MoveEvaluator
+
+
+def random_turn(rng):
+    """A hand, candidate moves drawn from it and a game state with 4 players"""
+    hand = [Card.from_id(card_id) for card_id in rng.sample(range(52), rng.randint(1, 13))]
+    moves = []
+    for _ in range(rng.randint(1, 15)):
+        cards = rng.sample(hand, rng.randint(0, min(5, len(hand))))
+        if rng.random() < 0.2:
+            moves.append(SimpleNamespace(cards=cards))  # no combo_type
+        else:
+            moves.append(SimpleNamespace(cards=cards, combo_type=rng.choice(list(ComboType))))
+    players = [
+        SimpleNamespace(hand=[Card.from_id(card_id) for card_id in rng.sample(range(52), rng.randint(0, 13))])
+        for _ in range(4)
+    ]
+    return moves, hand, SimpleNamespace(players=players)
+
+
+def reference_best(moves, hand, game_state, game_type):
+    """Score every move on a fresh evaluator; first maximum wins"""
+    evaluator = MoveEvaluator()
+    scores = [evaluator.evaluate_move(move, hand, game_state, game_type) for move in moves]
+    best = scores.index(max(scores))
+    return moves[best], scores[best]
+
+
+@pytest.mark.parametrize("game_type", ["tlmn", "sam"])
+def test_get_best_move_matches_full_scoring(game_type):
+    evaluator = MoveEvaluator()
+    rng = random.Random(game_type)
+
+    for _ in range(3000):
+        moves, hand, game_state = random_turn(rng)
+        expected_move, expected_score = reference_best(moves, hand, game_state, game_type)
+
+        best_move, best_score = evaluator.get_best_move(moves, hand, game_state, game_type)
+        assert best_move is expected_move
+        assert best_score == expected_score
+
+        top_move, top_score = evaluator.get_move_rankings(moves, hand, game_state, game_type)[0]
+        assert (top_move, top_score) == (best_move, best_score)
+
+
+def test_get_best_move_without_moves():
+    assert MoveEvaluator().get_best_move([], [], SimpleNamespace(players=[])) is None
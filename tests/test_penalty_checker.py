@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+"""PenaltyChecker nibble-mask predicates agree with per-rank counting."""
+
+import random
+from collections import Counter
+from types import SimpleNamespace
+
+import pytest
+
+pytest.importorskip("game_engine")
+
+from game_engine.core.card_encoding import Card, Rank, Suit
+
+from ai_common.penalty_avoidance.penalty_checker import PenaltyChecker
+from ai_common.penalty_avoidance.penalty_types import PenaltyRisk
+
+
+def has_consecutive_pairs(hand, run):
+    """Reference: sorted pair ranks contain `run` consecutive values"""
+    counts = Counter(card.rank.value for card in hand)
+    pairs = sorted(value for value, count in counts.items() if count >= 2)
+    return any(pairs[i + run - 1] - pairs[i] == run - 1 for i in range(len(pairs) - run + 1))
+
+
+def reference_tlmn_risks(hand):
+    risks = []
+    if any(card.rank == Rank.TWO and card.suit == Suit.SPADES for card in hand):
+        risks.append(PenaltyRisk.THOI_2_SPADES)
+    if any(count >= 4 for count in Counter(card.rank for card in hand).values()):
+        risks.append(PenaltyRisk.THOI_FOUR_KIND)
+    if has_consecutive_pairs(hand, 3):
+        risks.append(PenaltyRisk.THOI_THREE_PAIRS)
+    if has_consecutive_pairs(hand, 4):
+        risks.append(PenaltyRisk.THOI_FOUR_PAIRS)
+    return risks
+
+
+def reference_sam_risks(hand):
+    risks = []
+    if any(card.rank == Rank.TWO and card.suit == Suit.SPADES for card in hand):
+        risks.append(PenaltyRisk.THOI_2_SPADES_SAM)
+    if any(count >= 4 for count in Counter(card.rank for card in hand).values()):
+        risks.append(PenaltyRisk.THOI_FOUR_KIND_SAM)
+    if len(hand) > 5:
+        risks.append(PenaltyRisk.CONG)
+    return risks
+
+
+def random_hand(rng):
+    """Random hand, biased towards pairs, pair runs and quads"""
+    card_ids = set(rng.sample(range(52), rng.randint(0, 13)))
+    if rng.random() < 0.5:
+        start = rng.randrange(13)
+        for value in range(start, min(13, start + rng.randint(2, 5))):
+            card_ids.update(rng.sample([value + 13 * suit for suit in range(4)], rng.randint(2, 4)))
+    return [Card.from_id(card_id) for card_id in card_ids]
+
+
+def test_pair_and_quad_masks_match_rank_counts():
+    checker = PenaltyChecker()
+    rng = random.Random(6)
+
+    for _ in range(5000):
+        hand = random_hand(rng)
+        pair_mask, quad_mask = checker._pair_and_quad_masks(checker._hand_mask(hand))
+        counts = Counter(card.rank.value for card in hand)
+        assert pair_mask == sum(1 << 4 * value for value, count in counts.items() if count >= 2)
+        assert quad_mask == sum(1 << 4 * value for value, count in counts.items() if count == 4)
+
+
+def test_penalty_checks_match_reference():
+    checker = PenaltyChecker()
+    game_state = SimpleNamespace(players=[])
+    rng = random.Random(3)
+
+    for _ in range(30000):
+        hand = random_hand(rng)
+        assert checker.check_tlmn_penalties(hand, game_state) == reference_tlmn_risks(hand)
+        assert checker.check_sam_penalties(hand, game_state) == reference_sam_risks(hand)
+
+
+def test_risks_round_trip_through_labels():
+    for risk in PenaltyRisk:
+        assert PenaltyRisk.from_label(risk.label) is risk
+        assert PenaltyRisk(risk.label) is risk
+        assert PenaltyRisk(risk.value) is risk
+
+    with pytest.raises(ValueError):
+        PenaltyRisk.from_label("thoi_nothing")
+    with pytest.raises(ValueError):
+        PenaltyRisk("thoi_nothing")
@@ -0,0 +1,40 @@
+#!/usr/bin/env python3
+"""Unit tests for SamRuleEngine hand validation."""
+
+from ai_common.rules.sam_rule_engine import SamRuleEngine
+
+
+def single(rank):
+    return {"combo_type": "single", "rank_value": rank, "cards": [rank]}
+
+
+STRONG_COMBOS = [
+    {"combo_type": "straight", "rank_value": 11, "cards": [7, 8, 9, 10, 11]},
+    {"combo_type": "pair", "rank_value": 12, "cards": [12, 25]},
+]
+
+
+def test_weak_combo_reason_reports_full_count():
+    combos = [single(rank) for rank in range(4)] + STRONG_COMBOS
+
+    is_valid, reason, profile = SamRuleEngine().validate_hand(combos)
+
+    assert not is_valid
+    assert reason == "too_many_weak_combos_4"
+    assert profile == {}
+
+
+def test_rule_changes_after_construction_apply():
+    engine = SamRuleEngine()
+    combos = [single(rank) for rank in range(4)] + STRONG_COMBOS
+
+    engine.rules["max_weak_combos"] = 4
+    engine.rules["min_avg_strength"] = 0.4
+
+    is_valid, reason, profile = engine.validate_hand(combos)
+
+    assert is_valid, reason
+    assert profile["total_cards"] == 11
+
+    engine.rules["min_total_cards"] = 12
+    assert engine.validate_hand(combos)[1] == "insufficient_cards_11"
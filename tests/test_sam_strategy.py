@@ -0,0 +1,23 @@
+#!/usr/bin/env python3
+"""SamStrategy hand strength matches the plain rank-sum formula."""
+
+import random
+
+from ai_common.strategies import SamStrategy
+
+
+def plain_hand_strength(hand):
+    """Reference: the original sum of card % 13 over 12 per card"""
+    return sum(card % 13 for card in hand) / (len(hand) * 12) if hand else 0.0
+
+
+def test_hand_strength_matches_plain_formula():
+    strategy = SamStrategy()
+    rng = random.Random(7)
+
+    for _ in range(300):
+        # Ids past 51 (e.g. from a second deck) and repeats take the same formula
+        hand = [rng.randrange(104) for _ in range(rng.randint(0, 13))]
+        assert strategy._calculate_hand_strength(hand) == plain_hand_strength(hand)
+        distinct = sorted(set(hand))
+        assert strategy._calculate_hand_strength(distinct) == plain_hand_strength(distinct)
@@ -0,0 +1,49 @@
+#!/usr/bin/env python3
+"""Scoring terms skipped through a _HAS_* flag really are placeholders."""
+
+import random
+
+import pytest
+
+from ai_common.strategies import SamStrategy, TLMNStrategy
+
+
+def term_flags(strategy_cls):
+    """(flag, term method name) for every _HAS_<TERM> flag on the class"""
+    return [
+        (flag, "_calculate_" + flag[len("_HAS_"):].lower())
+        for flag in dir(strategy_cls) if flag.startswith("_HAS_")
+    ]
+
+
+FLAGGED_TERMS = [
+    (strategy_cls, flag, method)
+    for strategy_cls in (TLMNStrategy, SamStrategy)
+    for flag, method in term_flags(strategy_cls)
+]
+
+
+def test_every_strategy_has_flagged_terms():
+    assert {cls for cls, _, _ in FLAGGED_TERMS} == {TLMNStrategy, SamStrategy}
+
+
+@pytest.mark.parametrize("strategy_cls,flag,method", FLAGGED_TERMS,
+                         ids=lambda value: getattr(value, "__name__", value))
+def test_skipped_terms_return_zero(strategy_cls, flag, method):
+    strategy = strategy_cls()
+    term = getattr(strategy, method)
+    if getattr(strategy_cls, flag):
+        return  # implemented, so it is called
+    rng = random.Random(method)
+
+    for _ in range(200):
+        hand = rng.sample(range(52), rng.randint(0, 13))
+        move = {
+            "type": rng.choice(["play_cards", "pass"]),
+            "cards": rng.sample(hand, rng.randint(0, len(hand))),
+            "combo_type": rng.choice(["single", "pair", "straight", "double_seq"]),
+            "rank_value": rng.randrange(13),
+        }
+        assert term(move, {"hand": hand, "bao_sam_phase": True}) == 0.0, (
+            f"{strategy_cls.__name__}.{method} returns a score; set {flag} = True"
+        )
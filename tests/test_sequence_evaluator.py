@@ -2,76 +2,83 @@
 #!/usr/bin/env python3
 """Unit tests for SequenceEvaluator priority-based sequence generation."""
 
-import os
-import sys
-import unittest
-from typing import Dict, Any
-
-PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-if PROJECT_ROOT not in sys.path:
-    sys.path.insert(0, PROJECT_ROOT)
+from concurrent.futures import Executor, ProcessPoolExecutor
+
+import pytest
+
 from ai_common.core.sequence_evaluator import SequenceEvaluator
 
 
-RANK_NAMES = ["3", "4", "5", "6", "7", "8", "9", "10", "J", "Q", "K", "A", "2"]
-SUIT_NAMES = ["H", "D", "C", "S"]
+HAND_VARIANTS = {
+    "Mixed triple + straight": [34, 21, 33, 8, 35, 36, 37, 39, 1, 28],
+    "Four_kind heavy hand": [0, 13, 26, 39, 1, 14, 2, 15, 28, 3, 16],
+    "Double sequence potential": [4, 17, 30, 5, 18, 31, 6, 19, 32, 40, 41],
+    "Multiple twos scenario": [12, 25, 38, 11, 24, 37, 10, 23],
+    "Junk singles heavy": [0, 14, 27, 3, 16, 29, 7, 20, 33, 46],
+    "Short finish hand": [3, 16, 29, 8, 21, 34],  # straight + pair
+    "Strong finish ordering": [11, 24, 37, 34, 21, 8, 9, 22],
+}
 
 
-def decode_card(card_id: int) -> str:
-    return f"{RANK_NAMES[card_id % 13]}{SUIT_NAMES[card_id // 13]}"
+@pytest.fixture(scope="session")
+def evaluator():
+    """Evaluator shared by every hand variant."""
+    return SequenceEvaluator(enforce_full_coverage=False)
 
 
-def format_combo(combo: Dict[str, Any]) -> str:
-    cards = ", ".join(decode_card(c) for c in combo["cards"])
-    return f"{combo['type']}[{cards}]"
+@pytest.mark.parametrize("label,hand", HAND_VARIANTS.items(), ids=list(HAND_VARIANTS))
+def test_sequence_evaluator_hand_variants(evaluator, label, hand):
+    results = evaluator.evaluate_top_sequences(hand, k=3)
 
+    assert len(results) == 3
+    avg_strengths = [round(seq["avg_combo_strength"], 3) for seq in results]
+    assert avg_strengths == sorted(avg_strengths, reverse=True)
+    # Extra check for multi-2 case: ensure first combo is strong
+    if label == "Multiple twos scenario":
+        first_combo = results[0]["sequence"][0]
+        assert first_combo["type"] in {"straight", "four_kind", "triple", "pair"}
 
-class SequenceEvaluatorTests(unittest.TestCase):
-    """Validate core behaviors of the SequenceEvaluator."""
+    if label == "Junk singles heavy":
+        single_count = sum(
+            1 for seq in results for combo in seq["sequence"] if combo["type"] == "single"
+        )
+        assert single_count >= 4
 
-    def test_sequence_evaluator_hand_variants(self):
-        evaluator = SequenceEvaluator(enforce_full_coverage=False)
+    if label == "Strong finish ordering":
+        seq = results[0]["sequence"]
+        strengths = [combo["strength"] for combo in seq]
+        assert strengths[-1] == pytest.approx(min(strengths), abs=1e-7)
+        assert strengths[-2] == pytest.approx(max(strengths[:-1]), abs=1e-7)
 
-        test_cases = {
-            "Mixed triple + straight": [34, 21, 33, 8, 35, 36, 37, 39, 1, 28],
-            "Four_kind heavy hand": [0, 13, 26, 39, 1, 14, 2, 15, 28, 3, 16],
-            "Double sequence potential": [4, 17, 30, 5, 18, 31, 6, 19, 32, 40, 41],
-            "Multiple twos scenario": [12, 25, 38, 11, 24, 37, 10, 23],
-            "Junk singles heavy": [0, 14, 27, 3, 16, 29, 7, 20, 33, 46],
-            "Short finish hand": [3, 16, 29, 8, 21, 34],  # straight + pair
-            "Strong finish ordering": [11, 24, 37, 34, 21, 8, 9, 22],
-        }
 
-        for label, hand in test_cases.items():
-            results = evaluator.evaluate_top_sequences(hand, k=3)
+def test_batch_matches_single_hand_results():
+    evaluator = SequenceEvaluator()
+    hands = [
+        [34, 21, 33, 8, 35, 36, 37, 39, 1, 28],
+        [0, 13, 26, 39, 1, 14, 2, 15, 28, 3, 16],
+        [12, 25, 38, 11, 24, 37, 10, 23],
+    ]
 
-            print(f"\n{label} - Top 3 sequences:")
-            for idx, seq in enumerate(results, start=1):
-                combos_preview = [format_combo(combo) for combo in seq["sequence"]]
-                print(f"  #{idx} avg={seq['avg_combo_strength']:.3f} combos={combos_preview}")
+    expected = [evaluator.evaluate_top_sequences(hand, k=3) for hand in hands]
+    with ProcessPoolExecutor(max_workers=2) as executor:
+        assert evaluator.evaluate_top_sequences_batch(
+            hands, k=3, executor=executor, min_parallel_hands=1) == expected
+    assert evaluator.evaluate_top_sequences_batch(hands, k=3) == expected
+    assert evaluator.evaluate_top_sequences_batch([]) == []
 
-            self.assertEqual(len(results), 3)
-            avg_strengths = [round(seq["avg_combo_strength"], 3) for seq in results]
-            self.assertEqual(avg_strengths, sorted(avg_strengths, reverse=True))
-            # Extra check for multi-2 case: ensure first combo is strong
-            if label == "Multiple twos scenario":
-                first_combo = results[0]["sequence"][0]
-                self.assertIn(first_combo["type"], {"straight", "four_kind", "triple", "pair"})
-            
-            if label == "Junk singles heavy":
-                single_count = sum(
-                    1 for seq in results for combo in seq["sequence"] if combo["type"] == "single"
-                )
-                self.assertGreaterEqual(single_count, 4)
-            
-            if label == "Strong finish ordering":
-                seq = results[0]["sequence"]
-                strengths = [combo["strength"] for combo in seq]
-                self.assertAlmostEqual(strengths[-1], min(strengths))
-                self.assertAlmostEqual(strengths[-2], max(strengths[:-1]))
 
+class UnusableExecutor(Executor):
+    def submit(self, fn, *args, **kwargs):
+        raise AssertionError("small batches must not reach the executor")
 
 
-if __name__ == "__main__":
-    unittest.main()
+def test_small_batches_run_serially():
+    evaluator = SequenceEvaluator()
+    hands = [[0, 13, 26, 39, 1, 14], [12, 25, 38, 11]]
 
+    expected = [evaluator.evaluate_top_sequences(hand, k=3) for hand in hands]
+    assert evaluator.evaluate_top_sequences_batch(hands, k=3, executor=UnusableExecutor()) == expected
+
+
+if __name__ == "__main__":
+    raise SystemExit(pytest.main([__file__]))
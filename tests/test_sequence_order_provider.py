@@ -0,0 +1,34 @@
+#!/usr/bin/env python3
+"""Unit tests for SequenceOrderProvider ordering and caching."""
+
+import pytest
+
+from ai_common.providers.sequence_order_provider import SequenceOrderProvider
+
+
+HAND = [0, 13, 26, 1, 2, 3, 4, 5, 18, 31, 44, 12, 25]
+ORDER_STRATEGIES = ["strength_desc", "strength_asc", "pattern_based", "balanced"]
+
+
+@pytest.mark.parametrize("order_strategy", ORDER_STRATEGIES)
+def test_returned_sequence_does_not_alias_cache(order_strategy):
+    provider = SequenceOrderProvider()
+    first = provider.get_ordered_sequence(HAND, 4, order_strategy)
+    expected = [dict(combo, cards=list(combo["cards"])) for combo in first]
+
+    first[0]["cards"].append(99)
+    first[0]["extra"] = True
+    first.reverse()
+
+    assert provider.get_ordered_sequence(HAND, 4, order_strategy) == expected
+
+
+def test_consistency_result_does_not_alias_cache():
+    provider = SequenceOrderProvider()
+    expected = provider.get_ordered_sequence(HAND, 4, "pattern_based")
+
+    result = provider.validate_sequence_consistency(HAND)
+    result["provider_sequence"][0]["cards"].append(99)
+    result["unbeatable_sequence"][0]["cards"].append(99)
+
+    assert provider.get_ordered_sequence(HAND, 4, "pattern_based") == expected
@@ -0,0 +1,93 @@
+#!/usr/bin/env python3
+"""Move scoring on a caller-owned process pool matches serial scoring."""
+
+import pickle
+import random
+from concurrent.futures import ProcessPoolExecutor
+
+import pytest
+
+from ai_common.strategies import SamStrategy, TLMNStrategy
+from ai_common.strategies.base_strategy import StrategyConfig
+
+
+class SamWithBaoSamBonus(SamStrategy):
+    """Sam strategy with a real scoring term that reads state set after __init__"""
+
+    _HAS_BAO_SAM_BONUS = True
+
+    def __init__(self, config=None, executor=None):
+        super().__init__(config, executor)
+        self.card_bonus = 0.0
+
+    def _calculate_bao_sam_bonus(self, move, game_state):
+        return self.card_bonus * len(move.get("cards", []))
+
+
+@pytest.fixture(scope="module")
+def executor():
+    with ProcessPoolExecutor(max_workers=2) as pool:
+        yield pool
+
+
+def random_turns(seed, count=20):
+    rng = random.Random(seed)
+    for _ in range(count):
+        hand = rng.sample(range(52), 13)
+        moves = [
+            {
+                "type": rng.choice(["play_cards", "play_cards", "pass"]),
+                "cards": rng.sample(hand, rng.randint(1, 5)),
+                "combo_type": rng.choice(["single", "pair", "straight", "double_seq"]),
+                "rank_value": rng.randrange(13),
+            }
+            for _ in range(rng.randint(4, 24))
+        ]
+        yield moves, {"hand": hand, "bao_sam_phase": True}
+
+
+def make_pair(strategy_cls, game_type, executor):
+    serial = strategy_cls(StrategyConfig(name="serial", game_type=game_type))
+    pooled = strategy_cls(StrategyConfig(name="pooled", game_type=game_type, parallel_min_moves=4),
+                          executor)
+    return serial, pooled
+
+
+@pytest.mark.parametrize("strategy_cls,game_type", [
+    (TLMNStrategy, "tlmn"),
+    (SamWithBaoSamBonus, "sam"),
+])
+def test_pool_scores_match_serial(strategy_cls, game_type, executor):
+    serial, pooled = make_pair(strategy_cls, game_type, executor)
+
+    for moves, game_state in random_turns(game_type):
+        assert pooled._uses_scoring_pool(len(moves))
+        expected = [serial.evaluate_move(move, game_state) for move in moves]
+        assert pooled._score_moves_in_pool(moves, game_state) == expected
+        assert pooled._score_moves(moves, game_state) == expected
+        assert pooled.select_best_move(moves, game_state) is serial.select_best_move(moves, game_state)
+
+
+def test_pool_sees_state_set_after_init(executor):
+    serial, pooled = make_pair(SamWithBaoSamBonus, "sam", executor)
+    serial.card_bonus = pooled.card_bonus = 0.05
+
+    for moves, game_state in random_turns("state", count=5):
+        expected = [serial.evaluate_move(move, game_state) for move in moves]
+        assert pooled._score_moves_in_pool(moves, game_state) == expected
+
+
+def test_small_move_lists_and_no_executor_score_serially(executor):
+    _, pooled = make_pair(TLMNStrategy, "tlmn", executor)
+    assert not pooled._uses_scoring_pool(3)
+    assert not TLMNStrategy()._uses_scoring_pool(1000)
+
+
+def test_pickled_strategy_drops_executor(executor):
+    _, pooled = make_pair(TLMNStrategy, "tlmn", executor)
+
+    copy = pickle.loads(pickle.dumps(pooled))
+
+    assert pooled.executor is executor
+    assert copy.executor is None
+    assert copy.config == pooled.config
@@ -10,7 +10,8 @@ import sys
 import os
 from typing import List, Dict, Any
 
-# Add project root to path
+# Add project root to path (conftest.py does this under pytest; this keeps
+# running the file directly working)
 project_root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 sys.path.insert(0, project_root)
 
@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+"""TLMNStrategy selection and batch scoring agree with per-move evaluation."""
+
+import random
+
+import pytest
+
+from ai_common.strategies import TLMNStrategy
+
+
+COMBO_TYPES = ["single", "pair", "triple", "straight", "double_seq", "four_kind", "unknown"]
+
+
+class InvertedBaseScore(TLMNStrategy):
+    """Overrides a scoring hook; selection and batch scoring must pick it up"""
+
+    def _evaluate_base_move(self, move, game_state):
+        return 1.0 - super()._evaluate_base_move(move, game_state)
+
+
+def random_turn(rng):
+    """A hand (often holding 2s or a quad) and legal moves drawn from it"""
+    hand = rng.sample(range(52), rng.randint(1, 13))
+    if rng.random() < 0.3:
+        hand = list(dict.fromkeys(hand + rng.sample([12, 25, 38, 51], rng.randint(1, 4))))
+    if rng.random() < 0.2:
+        rank = rng.randrange(13)
+        hand = list(dict.fromkeys(hand + [rank, rank + 13, rank + 26, rank + 39]))
+
+    moves = []
+    for _ in range(rng.randint(1, 12)):
+        cards = rng.sample(hand, rng.randint(0, len(hand)))
+        move_type = rng.choice(["play_cards", "play_cards", "play_cards", "pass", "other"])
+        moves.append({
+            "type": move_type,
+            "cards": cards,
+            "combo_type": rng.choice(COMBO_TYPES),
+            "rank_value": rng.randrange(13),
+        })
+    if rng.random() < 0.3:
+        moves.append(dict(moves[0]))  # exact tie with an earlier move
+    return moves, {"hand": hand}
+
+
+def reference_select(strategy, moves, game_state):
+    """Filter, evaluate_move each valid move, first maximum wins (None if none is valid)"""
+    valid_moves = strategy._filter_tlmn_moves(moves, game_state)
+    if not valid_moves:
+        return None
+    scores = [strategy.evaluate_move(move, game_state) for move in valid_moves]
+    return valid_moves[scores.index(max(scores))]
+
+
+@pytest.mark.parametrize("strategy_cls", [TLMNStrategy, InvertedBaseScore], ids=lambda cls: cls.__name__)
+def test_select_and_batch_scoring_match_evaluate_move(strategy_cls):
+    strategy = strategy_cls()
+    rng = random.Random(11)
+
+    for _ in range(2000):
+        moves, game_state = random_turn(rng)
+
+        expected_scores = [strategy.evaluate_move(move, game_state) for move in moves]
+        assert strategy._score_moves(moves, game_state) == expected_scores
+
+        chosen = strategy.select_best_move(moves, game_state)
+        expected = reference_select(strategy, moves, game_state)
+        if expected is None:
+            assert chosen == {"type": "pass", "cards": []}
+        else:
+            assert chosen is expected
+
+
+def test_stock_evaluate_move_matches_plain_formula():
+    strategy = TLMNStrategy()
+    rng = random.Random(7)
+    bonus = {"straight": 0.2, "double_seq": 0.2}
+
+    for _ in range(2000):
+        moves, game_state = random_turn(rng)
+        for move in moves:
+            cards = move["cards"]
+            if move["type"] == "pass":
+                expected = 0.1
+            elif move["type"] == "play_cards" and cards:
+                expected = move["rank_value"] / 12.0 + bonus.get(move["combo_type"], 0.0)
+            else:
+                expected = 0.0
+            expected -= float(strategy._violates_tlmn_end_rules(move, game_state))
+            if len(cards) == 1 and cards[0] == 12:
+                expected += 0.5
+            assert strategy.evaluate_move(move, game_state) == max(0.0, expected)